@@ -1,21 +1,64 @@
-import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from evaluation import PIECE_VALUE
+from game import ChessGame
+from move_ordering import MoveOrderer
 from pieces import Color, PieceType
+from search_stats import SearchStats
+from transposition import TranspositionTable, EXACT, LOWER, UPPER
 
 
-PIECE_VALUE = {
-    PieceType.PAWN: 100,
-    PieceType.KNIGHT: 320,
-    PieceType.BISHOP: 330,
-    PieceType.ROOK: 500,
-    PieceType.QUEEN: 900,
-    PieceType.KING: 20000,
-}
+MAX_SEARCH_DEPTH = 64
+"""
+Adancimea maxima pentru cautarea limitata doar de timp.
+"""
+
+TIME_CHECK_NODES = 512
+"""
+La cate noduri cautate se verifica timpul ramas si daca cautarea a fost anulata.
+"""
+
+CANCEL_POLL_SECONDS = 0.05
+"""
+Cat de des verifica procesul principal anularea, in cautarea paralela.
+"""
+
+MAX_QUIESCENCE_DEPTH = 8
+"""
+Numarul maxim de semi-mutari adaugate de cautarea de quiescence.
+"""
+
+DELTA_MARGIN = 200
+"""
+Marja pentru delta pruning in quiescence: o captura este sarita daca
+nici castigul ei plus aceasta marja nu pot imbunatati scorul.
+"""
+
+MATE_SCORE = 1000000
+MATE_THRESHOLD = MATE_SCORE - 1000
+INFINITY = MATE_SCORE + 1
+"""
+Scorul unui mat (minus distanta in semi-mutari) si limitele ferestrei de cautare.
+"""
+
+ASPIRATION_WINDOW = 50
+"""
+Latimea initiala a ferestrei de aspiratie la radacina, in centipioni.
+"""
+
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+"""
+Null-move pruning: adancimea minima si reducerea (R) pentru cautarea dupa null move.
 """
-Dictionar care asociaza fiecarei piese o valoare numerica.
 
-Valorile sunt folosite pentru evaluarea materialului pe tabla:
-- valori pozitive favorizeaza albul
-- valori negative favorizeaza negrul (aplicate ulterior)
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVES = 3
+"""
+Late move reductions: mutarile linistite de la indexul LMR_MIN_MOVES incolo,
+la adancime cel putin LMR_MIN_DEPTH, sunt cautate redus.
 """
 
 
@@ -45,151 +88,759 @@ class ChessAI:
     """
     Clasa care implementeaza un adversar AI pentru sah.
 
-    AI-ul foloseste algoritmul minimax cu alpha-beta pruning
-    pentru a cauta cea mai buna mutare posibila.
+    Cautarea este un negamax cu alpha-beta pruning: scorul este intotdeauna
+    din perspectiva jucatorului la mutare, iar o singura functie trateaza
+    ambele culori. Peste el se aplica:
+    - principal variation search (PVS): prima mutare cu fereastra completa,
+      restul cu fereastra nula si re-cautare doar daca depasesc alpha
+    - ferestre de aspiratie la radacina, in jurul scorului iteratiei anterioare
+    - null-move pruning (dezactivat in sah si cand partea la mutare are doar pioni)
+    - late move reductions (LMR) pentru mutarile linistite cautate tarziu
+
+    Fiecare tehnica poate fi oprita din constructor, pentru comparatii.
+    Cu workers > 1, mutarile de la radacina sunt impartite intre mai multe
+    procese (GIL-ul face firele de executie inutile pentru cautare); procesele
+    importa din nou modulul principal, deci scriptul care foloseste workers > 1
+    trebuie sa aiba blocul if __name__ == "__main__".
+    Pozitiile deja cautate sunt memorate intr-o tabela de transpozitie
+    (self.tt), pastrata intre cautari. La fiecare nod mutarile sunt ordonate
+    de self.orderer (mutarea din tabela, capturi MVV-LVA, killer moves, history).
     """
 
-    def __init__(self, depth: int = 3):
+    def __init__(
+        self,
+        depth: int = 3,
+        tt_size_mb: float = 16,
+        use_pvs: bool = True,
+        use_aspiration: bool = True,
+        use_null_move: bool = True,
+        use_lmr: bool = True,
+        workers: int = 1,
+    ):
         """
         Initializeaza AI-ul cu o anumita adancime de cautare.
 
         :param depth: cate mutari inainte analizeaza AI-ul
+        :param tt_size_mb: memoria maxima a tabelei de transpozitie, in MB
+        :param use_pvs: activeaza principal variation search
+        :param use_aspiration: activeaza ferestrele de aspiratie la radacina
+        :param use_null_move: activeaza null-move pruning
+        :param use_lmr: activeaza late move reductions
+        :param workers: numarul de procese pentru cautarea paralela (1 = fara procese)
         """
         self.depth = max(1, int(depth))
+        self.tt = TranspositionTable(tt_size_mb)
+        self.orderer = MoveOrderer()
+        self.use_pvs = use_pvs
+        self.use_aspiration = use_aspiration
+        self.use_null_move = use_null_move
+        self.use_lmr = use_lmr
+        self.workers = max(1, int(workers))
+        self.last_score = None
+        self.last_lines = []
+        self.stats = SearchStats()
+        self._cancel = threading.Event()
+        self._pool = None
+        self._pool_stop = None
 
-    def choose_move(self, game):
+    def close(self):
         """
-        Alege cea mai buna mutare pentru jucatorul curent.
+        Opreste procesele folosite de cautarea paralela (daca exista).
+        """
+        if self._pool is not None:
+            self._pool_stop.set()
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_stop = None
 
-        Se genereaza toate mutarile legale, se ordoneaza
-        astfel incat capturile si promovarile sa fie evaluate primele,
-        apoi se aplica minimax pentru fiecare mutare.
+    def cancel(self):
+        """
+        Anuleaza cautarea in curs (poate fi apelata din alt fir de executie).
+        Cautarea se opreste in cel mult TIME_CHECK_NODES noduri si intoarce
+        cea mai buna mutare gasita pana atunci.
+        """
+        self._cancel.set()
+
+    def choose_move(self, game, time_ms=None, progress=None, cancel_token=None):
+        """
+        Alege cea mai buna mutare pentru jucatorul curent,
+        in notatie algebraica (pentru interfata grafica si fisiere).
 
         :param game: instanta ChessGame
+        :param time_ms: timpul maxim de cautare in milisecunde (optional)
+        :param progress: functie apelata dupa fiecare adancime terminata (vezi find_best_move)
+        :param cancel_token: eveniment de anulare (vezi find_best_move)
         :return: tuplu (from_square, to_square) sau None daca nu exista mutari
         """
-        color = game.current_player
-        best = None
-        best_score = -math.inf if color == Color.WHITE else math.inf
-
-        moves = game.get_all_legal_moves(color)
-
-        ordered = []
-        for (fp, tp, promo) in moves:
-            fr, fc = fp
-            tr, tc = tp
-            mover = game.board.get_piece(fr, fc)
-            cap = game.board.get_piece(tr, tc)
-            cap_value = 0 if cap is None else PIECE_VALUE[cap.piece_type]
-            promo_value = 0 if promo is None else PIECE_VALUE[promo]
-            ordered.append((cap_value + promo_value, fp, tp, promo))
-
-        ordered.sort(reverse=True, key=lambda x: x[0])
-
-        for _, fp, tp, promo in ordered:
-            snap = game.snapshot()
-            from_alg = game.coords_to_algebraic(fp[0], fp[1])
-            to_alg = game.coords_to_algebraic(tp[0], tp[1])
-            if promo is not None:
-                to_alg = to_alg + promo.value
-            try:
-                game.move(from_alg, to_alg)
-                score = self._minimax(game, self.depth - 1, -math.inf, math.inf)
-            except Exception:
-                game.restore(snap)
-                continue
-            game.restore(snap)
+        best = self.find_best_move(game, time_ms, progress, cancel_token)
+        if best is None:
+            return None
+        return game.move_to_algebraic(best)
+
+    def find_best_move(self, game, time_ms=None, progress=None, cancel_token=None, max_depth=None):
+        """
+        Alege cea mai buna mutare pentru jucatorul curent.
+
+        Cautarea foloseste iterative deepening: se cauta la adancimea 1,
+        apoi 2, ... iar cea mai buna mutare a iteratiei anterioare este
+        cautata prima (restul variantei principale vine din tabela de
+        transpozitie).
+
+        - fara time_ms, se cauta pana la self.depth
+        - cu time_ms, se cauta pana expira timpul (cel mult MAX_SEARCH_DEPTH)
+          si se intoarce rezultatul ultimei iteratii complete
+        - cu max_depth, se cauta cel mult pana la max_depth, chiar daca mai
+          este timp (de exemplu "go depth N movetime M" in UCI)
+
+        Scorul ultimei iteratii complete (din perspectiva jucatorului la
+        mutare) ramane in self.last_score, iar statisticile cautarii in self.stats.
+
+        Daca progress este dat, este apelata dupa fiecare adancime terminata cu
+        progress(depth, move, score, pv, stats): cea mai buna mutare, scorul ei,
+        varianta principala (lista de mutari, incepand cu move) si self.stats.
+        Mutarile sunt in formatul lui get_all_legal_moves
+        (game.move_to_algebraic le converteste pentru afisare).
+
+        Cautarea poate fi anulata setand cancel_token (de exemplu un
+        threading.Event, sau orice obiect cu metoda is_set()) sau apeland
+        cancel() din alt fir de executie. Se intoarce atunci mutarea ultimei
+        iteratii complete, sau, daca nicio iteratie nu s-a terminat, prima
+        mutare in ordinea de cautare (mutarea din tabela, apoi capturile).
+
+        :param game: instanta ChessGame
+        :param time_ms: timpul maxim de cautare in milisecunde (optional)
+        :param progress: functie apelata dupa fiecare adancime terminata (optional)
+        :param cancel_token: eveniment de anulare (optional)
+        :param max_depth: adancimea maxima (optional; inlocuieste self.depth)
+        :return: tuplu (from_pos, to_pos, promotion), in formatul lui
+                 get_all_legal_moves, sau None daca nu exista mutari
+        """
+        self._cancel = cancel_token if cancel_token is not None else threading.Event()
+        self.last_score = None
+        self.stats.reset()
+        moves = game.get_all_legal_moves(game.current_player)
+        if not moves:
+            return None
+
+        if self.workers > 1 and len(moves) > 1:
+            best = self._parallel_search(game, moves, time_ms, progress, max_depth)
+        else:
+            results = self._iterative_deepening(game, moves, time_ms, progress, max_depth=max_depth)
+            best = results[-1][0] if results else None
+        if best is None:
+            best = self.orderer.order(game, moves, 0, self.tt.best_move(game.zobrist_key))[0]
+        return best
+
+    def analyze(self, game, lines: int = 3, time_ms=None, progress=None, cancel_token=None):
+        """
+        Analiza multi-PV: cele mai bune `lines` mutari, cu scor si varianta principala.
+
+        Toate liniile vin dintr-o singura cautare (aceeasi tabela de
+        transpozitie, acelasi iterative deepening): la radacina, pragul
+        pentru o mutare noua este scorul celei de-a `lines`-a linii, nu
+        scorul celei mai bune, deci doar mutarile care intra in top sunt
+        cautate cu fereastra completa.
+
+        Analiza ruleaza intotdeauna intr-un singur proces. Parametrii
+        time_ms, progress si cancel_token au acelasi sens ca la
+        find_best_move (progress primeste linia cea mai buna).
+
+        :param game: instanta ChessGame
+        :param lines: numarul de linii cerute (K)
+        :return: lista de (mutare, scor, varianta principala), sortata dupa scor,
+                 cu cel mult `lines` elemente (goala daca nu exista mutari)
+        :raises ValueError: daca lines < 1
+        """
+        if lines < 1:
+            raise ValueError("lines must be at least 1")
+
+        self._cancel = cancel_token if cancel_token is not None else threading.Event()
+        self.last_score = None
+        self.last_lines = []
+        self.stats.reset()
+        moves = game.get_all_legal_moves(game.current_player)
+        if not moves:
+            return []
+
+        results = self._iterative_deepening(game, moves, time_ms, progress, min(lines, len(moves)))
+        if not results:
+            return []
+        depth = self.stats.iterations[-1][0]
+        return [(move, score, self.principal_variation(game, move, depth)) for move, score in self.last_lines]
+
+    def _iterative_deepening(self, game, moves, time_ms=None, progress=None, multipv=1, max_depth=None):
+        """
+        Ruleaza iterative deepening, cautand doar mutarile date la radacina.
+
+        Evenimentul de anulare este self._cancel, setat de apelant (find_best_move,
+        analyze sau un proces al cautarii paralele) o singura data pe cautare.
+
+        Liniile ultimei adancimi terminate, (mutare, scor) sortate dupa scor,
+        raman in self.last_lines (o singura linie cand multipv este 1).
+
+        :param moves: mutarile de la radacina (nevida)
+        :param progress: functie apelata dupa fiecare adancime terminata (vezi find_best_move)
+        :param multipv: numarul de linii cautate exact la radacina
+        :param max_depth: adancimea maxima; implicit self.depth fara time_ms
+                          si MAX_SEARCH_DEPTH cu time_ms
+        :return: lista cu (mutare, scor) pentru fiecare adancime terminata (1, 2, ...),
+                 goala daca a fost anulata inainte de prima
+        """
+        self.tt.new_search()
+        self.orderer.new_search()
+        stats = self.stats
+        stats.reset()
+        tt_hits, tt_misses = self.tt.hits, self.tt.misses
+        self._stopped = False
+        self._deadline = None if time_ms is None else time.perf_counter() + time_ms / 1000.0
+        self.last_score = None
+        if max_depth is None:
+            max_depth = self.depth if time_ms is None else MAX_SEARCH_DEPTH
+        max_depth = max(1, min(max_depth, MAX_SEARCH_DEPTH))
+
+        entry = self.tt.probe(game.zobrist_key)
+        ordered = self.orderer.order(game, moves, 0, entry[3] if entry is not None else None)
 
-            if color == Color.WHITE:
-                if score > best_score:
-                    best_score = score
-                    best = (from_alg, to_alg)
+        results = []
+        for depth in range(1, max_depth + 1):
+            if multipv > 1:
+                top = self._search_root_multipv(game, depth, ordered, multipv, can_stop=depth > 1)
+                if top is None:
+                    break
+                self.last_lines = top
+                result = top[0]
+                ranked = [move for move, _ in top]
+                ordered[:] = ranked + [move for move in ordered if move not in ranked]
             else:
-                if score < best_score:
-                    best_score = score
-                    best = (from_alg, to_alg)
+                result = self._search_with_aspiration(game, depth, ordered, can_stop=depth > 1)
+                if result is None:
+                    break
+                self.last_lines = [result]
+            results.append(result)
+            best, self.last_score = result
+            ordered.remove(best)
+            ordered.insert(0, best)
+
+            stats.tt_hits = self.tt.hits - tt_hits
+            stats.tt_misses = self.tt.misses - tt_misses
+            stats.record_iteration(depth)
+            if progress is not None:
+                progress(depth, best, self.last_score, self.principal_variation(game, best, depth), stats)
+
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                break
+
+        stats.finish()
+        return results
+
+    def principal_variation(self, game, first_move, max_length: int):
+        """
+        Reconstruieste varianta principala din tabela de transpozitie:
+        dupa first_move se urmeaza mutarea memorata pentru fiecare pozitie,
+        cat timp exista si este legala.
+
+        :param game: instanta ChessGame (este readusa la starea initiala)
+        :param first_move: mutarea de la radacina
+        :param max_length: lungimea maxima a variantei
+        :return: lista de mutari, incepand cu first_move
+        """
+        pv = [first_move]
+        undos = [game.make_move(first_move)]
+        seen = {game.zobrist_key}
+        while len(pv) < max_length:
+            move = self.tt.best_move(game.zobrist_key)
+            if move is None or move not in game.get_all_legal_moves(game.current_player):
+                break
+            pv.append(move)
+            undos.append(game.make_move(move))
+            if game.zobrist_key in seen:
+                break
+            seen.add(game.zobrist_key)
+        for undo in reversed(undos):
+            game.unmake_move(undo)
+        return pv
+
+    def _parallel_search(self, game, moves, time_ms=None, progress=None, max_depth=None):
+        """
+        Cautare paralela la radacina: mutarile, in ordinea data de orderer,
+        sunt impartite pe rand intre procese, fiecare proces ruleaza
+        iterative deepening doar pe mutarile lui, iar rezultatele sunt
+        comparate la cea mai mare adancime terminata de toate procesele.
 
+        Fiecare proces isi reconstruieste pozitia din FEN si are propria
+        tabela de transpozitie (de tt_size_mb), pastrata intre cautari.
+        Statisticile proceselor sunt adunate in self.stats, iar progress este
+        apelata la final, pentru fiecare adancime comparata, cu statisticile
+        cumulate pana la acea adancime (SearchStats.at_depth). Anularea este
+        transmisa proceselor printr-un multiprocessing.Event comun.
+
+        Procesele sunt pornite cu "spawn", nu cu "fork": cautarea poate rula
+        intr-un fir de executie (uci.py, ponder.py) in timp ce firul principal
+        tine blocat stdin sau alt lock, iar un proces obtinut prin fork ar
+        ramane blocat in acel lock.
+
+        :return: cea mai buna mutare, ca find_best_move, sau None daca
+                 nicio adancime nu a fost terminata de toate procesele
+        """
+        ordered = self.orderer.order(game, moves, 0)
+        chunks = [ordered[i::self.workers] for i in range(self.workers)]
+        chunks = [chunk for chunk in chunks if chunk]
+
+        if self._pool is None:
+            context = multiprocessing.get_context("spawn")
+            self._pool_stop = context.Event()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context, initializer=_init_worker, initargs=(self._pool_stop,)
+            )
+        fen = game.to_fen()
+        board_cls = type(game.board)
+        options = (self.depth, self.tt.size_mb, self.use_pvs, self.use_aspiration, self.use_null_move, self.use_lmr)
+        futures = [
+            self._pool.submit(_search_root_moves, fen, board_cls, chunk, time_ms, max_depth, options)
+            for chunk in chunks
+        ]
+        pending = set(futures)
+        while pending:
+            if self._cancel.is_set():
+                self._pool_stop.set()
+            _done, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+        self._pool_stop.clear()
+        outcomes = [future.result() for future in futures]
+
+        for _, _, stats in outcomes:
+            self.stats.merge(stats)
+        self.stats.finish()
+        max_depth = min(len(results) for results, _, _ in outcomes)
+        del self.stats.iterations[max_depth:]
+
+        best = None
+        for depth in range(1, max_depth + 1):
+            index = max(range(len(outcomes)), key=lambda i: outcomes[i][0][depth - 1][1])
+            results, pvs, _ = outcomes[index]
+            best, self.last_score = results[depth - 1]
+            if progress is not None:
+                progress(depth, best, self.last_score, pvs[depth - 1], self.stats.at_depth(depth))
         return best
 
-    def _terminal_score(self, game, depth):
+    def _search_with_aspiration(self, game, depth: int, ordered, can_stop=True):
+        """
+        Cauta radacina la adancimea data, folosind o fereastra de aspiratie
+        in jurul scorului iteratiei anterioare. Daca scorul iese din fereastra,
+        fereastra este largita pe partea respectiva si cautarea se repeta.
+
+        :return: tuplu (mutare, scor) sau None daca cautarea a fost intrerupta
+        """
+        if not self.use_aspiration or self.last_score is None or depth < 2:
+            return self._search_root(game, depth, ordered, -INFINITY, INFINITY, can_stop)
+
+        window = ASPIRATION_WINDOW
+        alpha = self.last_score - window
+        beta = self.last_score + window
+        while True:
+            result = self._search_root(game, depth, ordered, alpha, beta, can_stop)
+            if result is None:
+                return None
+            _move, score = result
+            if score <= alpha:
+                window *= 4
+                alpha = max(-INFINITY, score - window)
+            elif score >= beta:
+                window *= 4
+                beta = min(INFINITY, score + window)
+            else:
+                return result
+            if window >= INFINITY:
+                return self._search_root(game, depth, ordered, -INFINITY, INFINITY, can_stop)
+
+    def _search_root(self, game, depth: int, ordered, alpha: int, beta: int, can_stop=True):
+        """
+        O iteratie de cautare de la radacina, la adancimea data.
+
+        :param ordered: mutarile legale, in ordinea in care sunt cautate
+        :param can_stop: daca cautarea poate fi intrerupta de expirarea timpului
+        :return: tuplu (cea mai buna mutare, scor) sau None daca iteratia a fost intrerupta
+        """
+        self._can_stop = can_stop
+        alpha_orig = alpha
+        best = ordered[0]
+        best_score = -INFINITY
+
+        for index, move in enumerate(ordered):
+            undo = game.make_move(move)
+            if index == 0 or not self.use_pvs:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            else:
+                score = -self._negamax(game, depth - 1, -alpha - 1, -alpha, 1)
+                if alpha < score < beta:
+                    score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            game.unmake_move(undo)
+            if self._stopped:
+                return None
+
+            if score > best_score:
+                best_score = score
+                best = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if alpha_orig < best_score < beta:
+            self.tt.store(game.zobrist_key, depth, best_score, EXACT, best)
+        return best, best_score
+
+    def _search_root_multipv(self, game, depth: int, ordered, lines: int, can_stop=True):
+        """
+        O iteratie de cautare multi-PV de la radacina.
+
+        Primele `lines` mutari sunt cautate cu fereastra completa; celelalte
+        doar cu fereastra nula la scorul ultimei linii din top, si cautate
+        din nou (peste acel scor) daca il depasesc.
+
+        :return: lista de (mutare, scor) pentru cele mai bune `lines` mutari,
+                 sortata dupa scor, sau None daca iteratia a fost intrerupta
         """
-        Returneaza scorul pentru o pozitie terminala.
+        self._can_stop = can_stop
+        top = []
+        for move in ordered:
+            undo = game.make_move(move)
+            if len(top) < lines:
+                score = -self._negamax(game, depth - 1, -INFINITY, INFINITY, 1)
+            else:
+                threshold = top[-1][1]
+                score = -self._negamax(game, depth - 1, -threshold - 1, -threshold, 1)
+                if score > threshold:
+                    score = -self._negamax(game, depth - 1, -INFINITY, -threshold, 1)
+            game.unmake_move(undo)
+            if self._stopped:
+                return None
 
-        - checkmate: scor foarte mare negativ (pierdere)
+            if len(top) < lines or score > top[-1][1]:
+                top.append((move, score))
+                top.sort(key=lambda line: line[1], reverse=True)
+                del top[lines:]
+
+        self.tt.store(game.zobrist_key, depth, top[0][1], EXACT, top[0][0])
+        return top
+
+    def _check_time(self):
+        """
+        Numara nodurile si, la fiecare TIME_CHECK_NODES noduri, verifica
+        daca cautarea a fost anulata sau daca a expirat timpul alocat.
+        """
+        stats = self.stats
+        stats.nodes += 1
+        if stats.nodes % TIME_CHECK_NODES == 0:
+            if self._cancel.is_set():
+                self._stopped = True
+            elif self._deadline is not None and self._can_stop and time.perf_counter() >= self._deadline:
+                self._stopped = True
+
+    def _terminal_score(self, game, ply):
+        """
+        Returneaza scorul pentru o pozitie terminala,
+        din perspectiva jucatorului la mutare.
+
+        - checkmate: scor foarte mare negativ (pierdere); un mat mai
+          apropiat de radacina este mai rau, deci se aduna ply
         - stalemate: scor neutru
 
         :param game: instanta ChessGame
-        :param depth: adancimea ramasa
+        :param ply: distanta de la radacina
         :return: scor int sau None daca pozitia nu este terminala
         """
         status = game.get_status_for(game.current_player)
         if status == "checkmate":
-            return -1000000 + (self.depth - depth)
+            return -MATE_SCORE + ply
         if status == "stalemate":
             return 0
         return None
 
-    def _minimax(self, game, depth: int, alpha: float, beta: float) -> int:
+    def _has_non_pawn_material(self, game, color) -> bool:
+        """
+        Verifica daca o culoare mai are alte piese in afara de rege si pioni.
+        Fara ele (zugzwang frecvent), null-move pruning nu este sigur.
         """
-        Algoritmul minimax cu alpha-beta pruning.
+        board = game.board
+        for row, col in board.get_positions_of_color(color):
+            if board.get_piece(row, col).piece_type not in (PieceType.PAWN, PieceType.KING):
+                return True
+        return False
 
-        Simuleaza mutari alternative pentru ambii jucatori
-        si elimina ramurile care nu pot influenta rezultatul final.
+    def _negamax(self, game, depth: int, alpha: int, beta: int, ply: int, allow_null: bool = True) -> int:
+        """
+        Negamax cu alpha-beta pruning, PVS, null-move pruning si LMR.
 
         :param game: instanta ChessGame
         :param depth: adancimea ramasa de cautare
-        :param alpha: cel mai bun scor garantat pentru maximizator
-        :param beta: cel mai bun scor garantat pentru minimizator
-        :return: scorul evaluat al pozitiei
+        :param alpha: cel mai bun scor garantat pentru jucatorul la mutare
+        :param beta: scorul peste care adversarul evita aceasta pozitie
+        :param ply: distanta de la radacina
+        :param allow_null: permite un null move la acest nod
+        :return: scorul pozitiei din perspectiva jucatorului la mutare
         """
-        term = self._terminal_score(game, depth)
+        self._check_time()
+        if self._stopped:
+            return 0
+
+        term = self._terminal_score(game, ply)
         if term is not None:
             return term
 
-        if depth == 0:
-            return evaluate_material(game)
+        if depth <= 0:
+            return self._quiesce(game, alpha, beta, ply, 0)
 
         color = game.current_player
-        moves = game.get_all_legal_moves(color)
+        in_check = game.get_status_for(color) == "check"
+        key = game.zobrist_key
+        alpha_orig = alpha
 
-        if not moves:
-            return evaluate_material(game)
-
-        if color == Color.WHITE:
-            value = -math.inf
-            for fp, tp, promo in moves:
-                snap = game.snapshot()
-                from_alg = game.coords_to_algebraic(fp[0], fp[1])
-                to_alg = game.coords_to_algebraic(tp[0], tp[1])
-                if promo is not None:
-                    to_alg = to_alg + promo.value
-                try:
-                    game.move(from_alg, to_alg)
-                    value = max(value, self._minimax(game, depth - 1, alpha, beta))
-                except Exception:
-                    game.restore(snap)
-                    continue
-                game.restore(snap)
-                alpha = max(alpha, value)
+        tt_move = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            tt_depth, tt_score, tt_flag, tt_move = entry
+            if tt_depth >= depth:
+                tt_score = _score_from_tt(tt_score, ply)
+                if tt_flag == EXACT:
+                    return tt_score
+                if tt_flag == LOWER:
+                    alpha = max(alpha, tt_score)
+                elif tt_flag == UPPER:
+                    beta = min(beta, tt_score)
                 if alpha >= beta:
-                    break
-            return int(value)
+                    return tt_score
+
+        if (
+            self.use_null_move
+            and allow_null
+            and not in_check
+            and depth >= NULL_MOVE_MIN_DEPTH
+            and beta < MATE_THRESHOLD
+            and self._has_non_pawn_material(game, color)
+            and self._static_eval(game) >= beta
+        ):
+            undo = game.make_null_move()
+            score = -self._negamax(game, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1, False)
+            game.unmake_null_move(undo)
+            if self._stopped:
+                return 0
+            if score >= beta:
+                return beta
+
+        moves = self.orderer.order(game, game.get_all_legal_moves(color), ply, tt_move)
+        board = game.board
+
+        best_move = None
+        best_score = -INFINITY
+        for index, move in enumerate(moves):
+            quiet = move[2] is None and board.get_piece(move[1][0], move[1][1]) is None
+            undo = game.make_move(move)
+
+            if index == 0:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            else:
+                reduction = 0
+                if (
+                    self.use_lmr
+                    and quiet
+                    and not in_check
+                    and depth >= LMR_MIN_DEPTH
+                    and index >= LMR_MIN_MOVES
+                    and not game.is_in_check(game.current_player)
+                ):
+                    reduction = 1 if index < 2 * LMR_MIN_MOVES else 2
+
+                score = None
+                if reduction:
+                    score = -self._negamax(game, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)
+                if score is None or score > alpha:
+                    if self.use_pvs:
+                        score = -self._negamax(game, depth - 1, -alpha - 1, -alpha, ply + 1)
+                        if alpha < score < beta:
+                            score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+                    else:
+                        score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+
+            game.unmake_move(undo)
+            if self._stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.orderer.record_cutoff(game, move, ply, depth)
+                self.stats.record_cutoff(index)
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(key, depth, _score_to_tt(best_score, ply), flag, best_move)
+        return best_score
+
+    def _static_eval(self, game) -> int:
+        """
+        Evaluarea statica din perspectiva jucatorului la mutare.
+        """
+        score = game.evaluate()
+        return score if game.current_player == Color.WHITE else -score
+
+    def _quiesce(self, game, alpha: int, beta: int, ply: int, qply: int) -> int:
+        """
+        Cautare de quiescence la frunzele negamax-ului.
+
+        Se continua doar cu capturi si promovari, pana cand pozitia
+        devine "linistita", ca sa nu se evalueze pozitii in mijlocul unui
+        schimb de piese. Jucatorul la mutare poate alege sa nu captureze
+        (stand pat): evaluarea statica este o limita inferioara pentru scor.
+        Daca regele este in sah se cauta toate mutarile (evitarea sahului).
+
+        Capturile care nu pot aduce scorul peste alpha nici cu o marja
+        (delta pruning) si capturile unei piese mai ieftine decat atacatorul,
+        pe un patrat aparat, sunt sarite.
+
+        :param game: instanta ChessGame
+        :param alpha: cel mai bun scor garantat pentru jucatorul la mutare
+        :param beta: scorul peste care adversarul evita aceasta pozitie
+        :param ply: distanta de la radacina
+        :param qply: cate semi-mutari de quiescence s-au facut deja
+        :return: scorul pozitiei din perspectiva jucatorului la mutare
+        """
+        self._check_time()
+        self.stats.qnodes += 1
+        if self._stopped:
+            return 0
+
+        term = self._terminal_score(game, ply)
+        if term is not None:
+            return term
+
+        color = game.current_player
+        stand_pat = self._static_eval(game)
+        in_check = game.get_status_for(color) == "check"
+
+        if qply >= MAX_QUIESCENCE_DEPTH:
+            return stand_pat
+
+        if in_check:
+            moves = game.get_all_legal_moves(color)
+            best_score = -INFINITY
         else:
-            value = math.inf
-            for fp, tp, promo in moves:
-                snap = game.snapshot()
-                from_alg = game.coords_to_algebraic(fp[0], fp[1])
-                to_alg = game.coords_to_algebraic(tp[0], tp[1])
-                if promo is not None:
-                    to_alg = to_alg + promo.value
-                try:
-                    game.move(from_alg, to_alg)
-                    value = min(value, self._minimax(game, depth - 1, alpha, beta))
-                except Exception:
-                    game.restore(snap)
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+            moves = game.get_capture_moves(color)
+            best_score = stand_pat
+
+        board = game.board
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+        scored = []
+        for move in moves:
+            (fr, fc), (tr, tc), promo = move
+            victim = board.get_piece(tr, tc)
+            attacker_value = PIECE_VALUE[board.get_piece(fr, fc).piece_type]
+            if victim is not None:
+                gain = PIECE_VALUE[victim.piece_type]
+            elif promo is None:
+                gain = PIECE_VALUE[PieceType.PAWN]
+            else:
+                gain = 0
+            if promo is not None:
+                gain += PIECE_VALUE[promo]
+            elif not in_check:
+                if stand_pat + gain + DELTA_MARGIN <= alpha:
                     continue
-                game.restore(snap)
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break
-            return int(value)
+                if gain < attacker_value and board.is_square_attacked(tr, tc, enemy):
+                    continue
+            scored.append((gain * 16 - attacker_value // 100, move))
+        scored.sort(key=lambda x: x[0], reverse=True)
+
+        for _, move in scored:
+            undo = game.make_move(move)
+            score = -self._quiesce(game, -beta, -alpha, ply + 1, qply + 1)
+            game.unmake_move(undo)
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        return best_score
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    """
+    Converteste un scor de mat din "distanta de la radacina" in
+    "distanta de la nodul curent", ca sa poata fi refolosit din tabela
+    de transpozitie la alt ply.
+    """
+    if score >= MATE_THRESHOLD:
+        return score + ply
+    if score <= -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    """
+    Inversul lui _score_to_tt: readuce un scor de mat din tabela la ply-ul curent.
+    """
+    if score >= MATE_THRESHOLD:
+        return score - ply
+    if score <= -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+_worker_ai = None
+_worker_stop = None
+"""
+AI-ul unui proces din cautarea paralela, pastrat intre cautari (pentru tabela
+de transpozitie), si evenimentul prin care procesul principal anuleaza cautarea.
+"""
+
+
+def _init_worker(stop_event):
+    """
+    Initializeaza un proces din cautarea paralela a lui ChessAI.
+    """
+    global _worker_stop
+    _worker_stop = stop_event
+
+
+def _search_root_moves(fen, board_cls, moves, time_ms, max_depth, options):
+    """
+    Functia rulata intr-un proces de cautarea paralela a lui ChessAI.
+
+    :param fen: pozitia de la radacina
+    :param board_cls: clasa tablei (Board sau BitboardBoard)
+    :param moves: mutarile de la radacina cautate de acest proces
+    :param time_ms: timpul maxim de cautare in milisecunde (sau None)
+    :param max_depth: adancimea maxima (sau None, ca la find_best_move)
+    :param options: (depth, tt_size_mb, use_pvs, use_aspiration, use_null_move, use_lmr)
+    :return: tuplu (rezultate pe adancimi, variante principale pe adancimi, SearchStats)
+    """
+    global _worker_ai
+    depth, tt_size_mb, use_pvs, use_aspiration, use_null_move, use_lmr = options
+    if _worker_ai is None or _worker_ai.tt.size_mb != tt_size_mb:
+        _worker_ai = ChessAI(depth, tt_size_mb)
+    _worker_ai.depth = depth
+    _worker_ai.use_pvs = use_pvs
+    _worker_ai.use_aspiration = use_aspiration
+    _worker_ai.use_null_move = use_null_move
+    _worker_ai.use_lmr = use_lmr
+
+    game = ChessGame.from_fen(fen, board_cls())
+    pvs = []
+    _worker_ai._cancel = _worker_stop
+    results = _worker_ai._iterative_deepening(
+        game, list(moves), time_ms, lambda *args: pvs.append(args[3]), max_depth=max_depth
+    )
+    return results, pvs, _worker_ai.stats
@@ -0,0 +1,492 @@
+from pieces import Piece, PieceType, Color
+
+
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KNIGHT_OFFSETS = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2),
+)
+KING_OFFSETS = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1),
+)
+
+
+def square_index(row, col):
+    """
+    Converteste (row, col) in indexul bitului corespunzator (0..63).
+
+    a1 = 0, b1 = 1, ..., h8 = 63.
+    """
+    return row * 8 + col
+
+
+def _on_board(row, col):
+    return 0 <= row < 8 and 0 <= col < 8
+
+
+def _leaper_table(offsets):
+    """
+    Construieste, pentru fiecare patrat, masca patratelor atinse
+    printr-un singur salt (cal, rege).
+    """
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if _on_board(r, c):
+                mask |= 1 << square_index(r, c)
+        table.append(mask)
+    return table
+
+
+def _pawn_attack_table(direction):
+    """
+    Construieste masca patratelor atacate de un pion de pe fiecare patrat.
+    """
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        r = row + direction
+        for dc in (-1, 1):
+            c = col + dc
+            if _on_board(r, c):
+                mask |= 1 << square_index(r, c)
+        table.append(mask)
+    return table
+
+
+def _ray_table(dr, dc):
+    """
+    Construieste, pentru fiecare patrat, masca razei pe directia (dr, dc),
+    fara patratul de plecare.
+    """
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        r, c = row + dr, col + dc
+        while _on_board(r, c):
+            mask |= 1 << square_index(r, c)
+            r += dr
+            c += dc
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _leaper_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _leaper_table(KING_OFFSETS)
+PAWN_ATTACKS = (_pawn_attack_table(1), _pawn_attack_table(-1))
+"""
+Tabele precalculate la import: pentru fiecare patrat, masca patratelor atacate
+(PAWN_ATTACKS este indexat dupa indexul culorii: 0 alb, 1 negru).
+"""
+
+KING, QUEEN, ROOK, BISHOP, KNIGHT, PAWN = range(6)
+WHITE, BLACK = 0, 1
+"""
+Indecsii tipurilor de piese si ai culorilor folositi in BitboardBoard: bitboard-ul
+pieselor de tipul t si culoarea c este bitboards[c * 6 + t].
+"""
+
+TYPE_INDEX = {
+    PieceType.KING.value: KING,
+    PieceType.QUEEN.value: QUEEN,
+    PieceType.ROOK.value: ROOK,
+    PieceType.BISHOP.value: BISHOP,
+    PieceType.KNIGHT.value: KNIGHT,
+    PieceType.PAWN.value: PAWN,
+}
+COLOR_INDEX = {Color.WHITE.value: WHITE, Color.BLACK.value: BLACK}
+"""
+Conversia din PieceType / Color in indecsi, dupa valoarea membrului (_value_).
+Un dictionar indexat dupa sir este de cateva ori mai rapid decat unul indexat
+dupa membrul Enum, al carui __hash__ este scris in Python.
+"""
+
+RAYS = {(dr, dc): _ray_table(dr, dc) for (dr, dc) in ROOK_DIRECTIONS + BISHOP_DIRECTIONS}
+"""
+Razele pentru piesele liniare. O directie este "pozitiva" daca indexul
+patratului creste de-a lungul ei; atunci primul blocaj este bitul cel mai mic,
+altfel este bitul cel mai mare.
+"""
+
+ROOK_RAYS = tuple((RAYS[d], d[0] * 8 + d[1] > 0) for d in ROOK_DIRECTIONS)
+BISHOP_RAYS = tuple((RAYS[d], d[0] * 8 + d[1] > 0) for d in BISHOP_DIRECTIONS)
+
+ROOK_LINES = [RAYS[(1, 0)][sq] | RAYS[(-1, 0)][sq] | RAYS[(0, 1)][sq] | RAYS[(0, -1)][sq] for sq in range(64)]
+BISHOP_LINES = [RAYS[(1, 1)][sq] | RAYS[(1, -1)][sq] | RAYS[(-1, 1)][sq] | RAYS[(-1, -1)][sq] for sq in range(64)]
+"""
+Toate patratele de pe razele ortogonale / diagonale ale unui patrat, pe tabla goala.
+Daca nu contin nicio piesa liniara inamica, razele nu mai trebuie parcurse.
+"""
+
+SQUARE_COORDS = [divmod(sq, 8) for sq in range(64)]
+"""
+Coordonatele (row, col) ale fiecarui index de patrat, ca mask_to_squares sa nu
+construiasca un tuplu nou pentru fiecare bit.
+"""
+
+RANK_2 = 0xFF << 8
+RANK_7 = 0xFF << 48
+
+
+def sliding_attacks(sq, occupied, rays):
+    """
+    Calculeaza masca atacurilor unei piese liniare de pe patratul sq.
+
+    Pentru fiecare raza se gaseste primul blocaj si se elimina
+    tot ce se afla dincolo de el.
+    """
+    attacks = 0
+    for table, positive in rays:
+        ray = table[sq]
+        blockers = ray & occupied
+        if blockers:
+            if positive:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            ray ^= table[first]
+        attacks |= ray
+    return attacks
+
+
+def mask_to_squares(mask):
+    """
+    Converteste o masca de biti in lista de patrate (row, col).
+    """
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(SQUARE_COORDS[low.bit_length() - 1])
+        mask ^= low
+    return out
+
+
+class BitboardBoard:
+    """
+    Tabla de sah implementata cu bitboard-uri (intregi pe 64 de biti).
+
+    Pastreaza aceeasi interfata publica ca Board (get_piece, set_piece,
+    get_legal_moves, is_square_attacked etc.), astfel incat ChessGame,
+    ChessAI si interfata grafica pot folosi oricare dintre cele doua table.
+
+    Se ocupa de:
+    - cate un bitboard pentru fiecare tip de piesa si culoare, intr-o lista
+      plata de 12 intregi indexata dupa culoare * 6 + tip (vezi TYPE_INDEX)
+    - ocuparea pe culori (lista indexata dupa culoare) si ocuparea totala
+    - o lista de 64 de patrate cu obiectele Piece, pentru get_piece in O(1)
+    - generarea mutarilor si testarea atacurilor prin operatii pe masti
+    """
+
+    def __init__(self):
+        """
+        Creeaza o tabla goala si pune piesele in pozitia initiala.
+        """
+        self.clear()
+        self.setup_initial_position()
+
+    def clear(self):
+        """
+        Goleste complet tabla.
+        """
+        self.bitboards = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.squares = [None] * 64
+
+    def copy(self):
+        """
+        Returneaza o copie a tablei (obiectele Piece sunt partajate).
+        """
+        new_board = BitboardBoard.__new__(BitboardBoard)
+        new_board.bitboards = self.bitboards[:]
+        new_board.occupancy = self.occupancy[:]
+        new_board.occupied = self.occupied
+        new_board.squares = self.squares[:]
+        return new_board
+
+    def in_bounds(self, row, col):
+        """
+        Verifica daca o pozitie (row, col) se afla in interiorul tablei.
+        """
+        return 0 <= row < 8 and 0 <= col < 8
+
+    def get_piece(self, row, col):
+        """
+        Returneaza piesa de pe patratul (row, col) sau None daca este gol.
+        """
+        return self.squares[row * 8 + col]
+
+    def set_piece(self, row, col, piece):
+        """
+        Plaseaza o piesa (sau None) pe patratul (row, col),
+        actualizand bitboard-urile si ocuparea.
+        """
+        sq = row * 8 + col
+        bit = 1 << sq
+        squares = self.squares
+        old = squares[sq]
+        if old is not None:
+            color = COLOR_INDEX[old.color._value_]
+            self.bitboards[color * 6 + TYPE_INDEX[old.piece_type._value_]] ^= bit
+            self.occupancy[color] ^= bit
+            self.occupied ^= bit
+        squares[sq] = piece
+        if piece is not None:
+            color = COLOR_INDEX[piece.color._value_]
+            self.bitboards[color * 6 + TYPE_INDEX[piece.piece_type._value_]] |= bit
+            self.occupancy[color] |= bit
+            self.occupied |= bit
+
+    def setup_initial_position(self):
+        """
+        Seteaza tabla in pozitia initiala standard de sah.
+        """
+        order = [
+            PieceType.ROOK,
+            PieceType.KNIGHT,
+            PieceType.BISHOP,
+            PieceType.QUEEN,
+            PieceType.KING,
+            PieceType.BISHOP,
+            PieceType.KNIGHT,
+            PieceType.ROOK,
+        ]
+
+        for col, ptype in enumerate(order):
+            self.set_piece(0, col, Piece(ptype, Color.WHITE))
+
+        for col, ptype in enumerate(order):
+            self.set_piece(7, col, Piece(ptype, Color.BLACK))
+
+        for col in range(8):
+            self.set_piece(1, col, Piece(PieceType.PAWN, Color.WHITE))
+            self.set_piece(6, col, Piece(PieceType.PAWN, Color.BLACK))
+
+    def is_empty(self, row, col) -> bool:
+        """
+        Verifica daca patratul este gol (nu are piesa).
+        """
+        return not (self.occupied >> (row * 8 + col)) & 1
+
+    def is_ally(self, row, col, color) -> bool:
+        """
+        Verifica daca pe patrat este o piesa de aceeasi culoare.
+        """
+        return bool((self.occupancy[COLOR_INDEX[color._value_]] >> (row * 8 + col)) & 1)
+
+    def is_enemy(self, row, col, color) -> bool:
+        """
+        Verifica daca pe patrat este o piesa inamica.
+        """
+        enemy = 1 - COLOR_INDEX[color._value_]
+        return bool((self.occupancy[enemy] >> (row * 8 + col)) & 1)
+
+    def find_king(self, color):
+        """
+        Gaseste pozitia regelui pentru o anumita culoare.
+
+        :return: (row, col) unde se afla regele
+        :raises ValueError: daca regele nu este gasit pe tabla
+        """
+        kings = self.bitboards[COLOR_INDEX[color._value_] * 6 + KING]
+        if not kings:
+            raise ValueError(f"King not found for {color}")
+        sq = (kings & -kings).bit_length() - 1
+        return sq >> 3, sq & 7
+
+    def get_positions_of_color(self, color):
+        """
+        Returneaza toate pozitiile pieselor unei culori.
+
+        :return: lista de tuple (row, col)
+        """
+        return mask_to_squares(self.occupancy[COLOR_INDEX[color._value_]])
+
+    def _attack_mask(self, sq, ptype, color):
+        """
+        Returneaza masca patratelor atacate de o piesa de tipul ptype si
+        culoarea color (indecsi) de pe patratul sq.
+        """
+        if ptype == PAWN:
+            return PAWN_ATTACKS[color][sq]
+        if ptype == KNIGHT:
+            return KNIGHT_ATTACKS[sq]
+        if ptype == KING:
+            return KING_ATTACKS[sq]
+        if ptype == ROOK:
+            return sliding_attacks(sq, self.occupied, ROOK_RAYS)
+        if ptype == BISHOP:
+            return sliding_attacks(sq, self.occupied, BISHOP_RAYS)
+        return sliding_attacks(sq, self.occupied, ROOK_RAYS) | sliding_attacks(sq, self.occupied, BISHOP_RAYS)
+
+    def _attack_squares(self, row, col):
+        """
+        Calculeaza patratele pe care le ataca piesa de la (row, col).
+        """
+        piece = self.get_piece(row, col)
+        if piece is None:
+            return []
+        ptype = TYPE_INDEX[piece.piece_type._value_]
+        return mask_to_squares(self._attack_mask(row * 8 + col, ptype, COLOR_INDEX[piece.color._value_]))
+
+    def is_square_attacked(self, row, col, by_color):
+        """
+        Verifica daca un patrat (row, col) este atacat de o anumita culoare.
+
+        Se pleaca de la patratul tinta: un patrat este atacat de un cal
+        daca exista un cal inamic pe patratele de salt ale calului,
+        de o tura/regina daca exista una pe razele de tura etc.
+        """
+        sq = row * 8 + col
+        attacker = COLOR_INDEX[by_color._value_]
+        boards = self.bitboards
+        base = attacker * 6
+
+        if KNIGHT_ATTACKS[sq] & boards[base + KNIGHT]:
+            return True
+        if KING_ATTACKS[sq] & boards[base + KING]:
+            return True
+        if PAWN_ATTACKS[1 - attacker][sq] & boards[base + PAWN]:
+            return True
+
+        queens = boards[base + QUEEN]
+        rooks = (boards[base + ROOK] | queens) & ROOK_LINES[sq]
+        if rooks and sliding_attacks(sq, self.occupied, ROOK_RAYS) & rooks:
+            return True
+        bishops = (boards[base + BISHOP] | queens) & BISHOP_LINES[sq]
+        if bishops and sliding_attacks(sq, self.occupied, BISHOP_RAYS) & bishops:
+            return True
+        return False
+
+    def checkers_and_pins(self, color, king_pos):
+        """
+        Calculeaza piesele care dau sah regelui culorii color si piesele
+        proprii legate (pinned), cu aceeasi semnificatie ca Board.checkers_and_pins.
+
+        Caii si pionii care dau sah se obtin direct din masti. Pe fiecare raza
+        care pleaca din rege si contine o piesa liniara inamica se cauta primul
+        blocaj: daca este atacatorul, regele este in sah; daca este o piesa
+        proprie si urmatorul blocaj este atacatorul, piesa proprie este legata.
+
+        :return: tuplu (checkers, block_squares, pins)
+        """
+        kr, kc = king_pos
+        ksq = kr * 8 + kc
+        us = COLOR_INDEX[color._value_]
+        boards = self.bitboards
+        base = (1 - us) * 6
+        own = self.occupancy[us]
+        occupied = self.occupied
+        checkers = 0
+        block_squares = None
+        pins = {}
+
+        queens = boards[base + QUEEN]
+        for rays, sliders in (
+            (ROOK_RAYS, (boards[base + ROOK] | queens) & ROOK_LINES[ksq]),
+            (BISHOP_RAYS, (boards[base + BISHOP] | queens) & BISHOP_LINES[ksq]),
+        ):
+            if not sliders:
+                continue
+            for table, positive in rays:
+                ray = table[ksq]
+                if not ray & sliders:
+                    continue
+                blockers = ray & occupied
+                first = (blockers & -blockers).bit_length() - 1 if positive else blockers.bit_length() - 1
+                bit = 1 << first
+                if bit & sliders:
+                    checkers += 1
+                    block_squares = set(mask_to_squares(ray ^ table[first]))
+                elif bit & own:
+                    rest = table[first] & occupied
+                    if not rest:
+                        continue
+                    second = (rest & -rest).bit_length() - 1 if positive else rest.bit_length() - 1
+                    if (1 << second) & sliders:
+                        pins[(first >> 3, first & 7)] = set(mask_to_squares(ray ^ table[second]))
+
+        for attackers in (KNIGHT_ATTACKS[ksq] & boards[base + KNIGHT], PAWN_ATTACKS[us][ksq] & boards[base + PAWN]):
+            if attackers:
+                squares = mask_to_squares(attackers)
+                checkers += len(squares)
+                block_squares = set(squares)
+
+        return checkers, block_squares, pins
+
+    def __str__(self):
+        """
+        Returneaza o reprezentare ASCII a tablei pentru debug.
+        """
+        lines = []
+        for row in range(7, -1, -1):
+            line = [str(row + 1)]
+            for col in range(8):
+                piece = self.get_piece(row, col)
+                line.append(piece.symbol if piece else ".")
+            lines.append(" ".join(line))
+        lines.append("  a b c d e f g h")
+        return "\n".join(lines)
+
+    def get_legal_moves(self, row, col):
+        """
+        Returneaza mutarile de baza legale pentru piesa de la (row, col),
+        fara a verifica daca regele ramane in sah.
+
+        :return: lista de patrate tinta (row, col)
+        """
+        sq = row * 8 + col
+        piece = self.squares[sq]
+        if piece is None:
+            return []
+
+        color = COLOR_INDEX[piece.color._value_]
+        ptype = TYPE_INDEX[piece.piece_type._value_]
+        own = self.occupancy[color]
+
+        if ptype != PAWN:
+            return mask_to_squares(self._attack_mask(sq, ptype, color) & ~own)
+
+        enemy = self.occupied & ~own
+        empty = ~self.occupied
+        bit = 1 << sq
+        if color == WHITE:
+            pushes = (bit << 8) & empty
+            if pushes and bit & RANK_2:
+                pushes |= (bit << 16) & empty
+        else:
+            pushes = (bit >> 8) & empty
+            if pushes and bit & RANK_7:
+                pushes |= (bit >> 16) & empty
+        return mask_to_squares(pushes | (PAWN_ATTACKS[color][sq] & enemy))
+
+    def move_piece(self, from_row, from_col, to_row, to_col):
+        """
+        Muta o piesa pe tabla folosind regulile de baza de miscare.
+
+        Important:
+        - nu verifica randul
+        - nu verifica sah
+        - nu gestioneaza rocada/en passant/promovare (acestea sunt in game.py)
+        """
+        piece = self.get_piece(from_row, from_col)
+        if piece is None:
+            raise ValueError("No piece at start square")
+
+        legal_moves = self.get_legal_moves(from_row, from_col)
+        if (to_row, to_col) not in legal_moves:
+            raise ValueError("Illegal move for selected piece")
+
+        dest_piece = self.get_piece(to_row, to_col)
+        if dest_piece is not None and dest_piece.color == piece.color:
+            raise ValueError("Cannot move onto same color piece")
+
+        self.set_piece(to_row, to_col, piece)
+        self.set_piece(from_row, from_col, None)
@@ -1,6 +1,94 @@
 from pieces import Piece, PieceType, Color
 
 
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KNIGHT_OFFSETS = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2),
+)
+KING_OFFSETS = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1),
+)
+
+
+def _build_jump_table(offsets):
+    """
+    Construieste, pentru fiecare patrat (row, col), lista patratelor
+    atinse printr-un singur salt (cal sau rege).
+
+    :return: matrice 8x8 de liste de tuple (row, col)
+    """
+    table = [[None for _ in range(8)] for _ in range(8)]
+    for row in range(8):
+        for col in range(8):
+            table[row][col] = [
+                (row + dr, col + dc)
+                for dr, dc in offsets
+                if 0 <= row + dr < 8 and 0 <= col + dc < 8
+            ]
+    return table
+
+
+def _build_pawn_attacker_table(direction):
+    """
+    Construieste, pentru fiecare patrat, lista patratelor de pe care un pion
+    care avanseaza in directia data ar ataca patratul respectiv.
+    """
+    table = [[None for _ in range(8)] for _ in range(8)]
+    for row in range(8):
+        for col in range(8):
+            r = row - direction
+            table[row][col] = [(r, col + dc) for dc in (-1, 1) if 0 <= r < 8 and 0 <= col + dc < 8]
+    return table
+
+
+def _build_ray_table(directions):
+    """
+    Construieste, pentru fiecare patrat, razele pe directiile date.
+    Fiecare raza este lista patratelor in ordinea departarii de origine.
+    """
+    table = [[None for _ in range(8)] for _ in range(8)]
+    for row in range(8):
+        for col in range(8):
+            rays = []
+            for dr, dc in directions:
+                ray = []
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    ray.append((r, c))
+                    r += dr
+                    c += dc
+                if ray:
+                    rays.append(ray)
+            table[row][col] = rays
+    return table
+
+
+KNIGHT_TABLE = _build_jump_table(KNIGHT_OFFSETS)
+KING_TABLE = _build_jump_table(KING_OFFSETS)
+PAWN_ATTACKERS = {
+    Color.WHITE: _build_pawn_attacker_table(1),
+    Color.BLACK: _build_pawn_attacker_table(-1),
+}
+ROOK_RAYS = _build_ray_table(ROOK_DIRECTIONS)
+BISHOP_RAYS = _build_ray_table(BISHOP_DIRECTIONS)
+"""
+Tabele precalculate o singura data, la import.
+
+KNIGHT_TABLE / KING_TABLE: patratele atinse dintr-un salt
+PAWN_ATTACKERS[color]: patratele de pe care un pion de culoarea color ataca patratul
+ROOK_RAYS / BISHOP_RAYS: razele ortogonale / diagonale care pleaca din patrat
+"""
+
+ROOK_SLIDERS = (PieceType.ROOK, PieceType.QUEEN)
+BISHOP_SLIDERS = (PieceType.BISHOP, PieceType.QUEEN)
+"""
+Piesele care ataca pe razele ortogonale, respectiv diagonale.
+"""
+
+
 class Board:
     """
     Reprezinta tabla de sah 8x8 si operatiile de baza pe tabla.
@@ -17,9 +105,17 @@ class Board:
         """
         Creeaza o tabla goala 8x8 si pune piesele in pozitia initiala.
         """
-        self.grid = [[None for _ in range(8)] for _ in range(8)]
+        self.clear()
         self.setup_initial_position()
 
+    def clear(self):
+        """
+        Goleste complet tabla.
+        """
+        self.grid = [[None for _ in range(8)] for _ in range(8)]
+        self.positions = {Color.WHITE: set(), Color.BLACK: set()}
+        self.kings = {Color.WHITE: None, Color.BLACK: None}
+
     def in_bounds(self, row, col):
         """
         Verifica daca o pozitie (row, col) se afla in interiorul tablei.
@@ -37,9 +133,36 @@ class Board:
     def set_piece(self, row, col, piece):
         """
         Plaseaza o piesa (sau None) pe patratul (row, col).
+
+        Actualizeaza incremental si listele de pozitii pe culori
+        si pozitiile regilor.
         """
+        old = self.grid[row][col]
+        if old is not None:
+            self.positions[old.color].discard((row, col))
+            if old.piece_type == PieceType.KING and self.kings[old.color] == (row, col):
+                self.kings[old.color] = None
+
         self.grid[row][col] = piece
 
+        if piece is not None:
+            self.positions[piece.color].add((row, col))
+            if piece.piece_type == PieceType.KING:
+                self.kings[piece.color] = (row, col)
+
+    def copy(self):
+        """
+        Returneaza o copie a tablei.
+
+        Matricea este copiata, iar obiectele Piece sunt partajate
+        (piesele nu se modifica dupa ce sunt create).
+        """
+        new_board = Board.__new__(Board)
+        new_board.grid = [row[:] for row in self.grid]
+        new_board.positions = {color: set(squares) for color, squares in self.positions.items()}
+        new_board.kings = dict(self.kings)
+        return new_board
+
     def setup_initial_position(self):
         """
         Seteaza tabla in pozitia initiala standard de sah.
@@ -95,29 +218,26 @@ class Board:
         """
         Gaseste pozitia regelui pentru o anumita culoare.
 
+        Pozitia este mentinuta incremental de set_piece, deci cautarea este O(1).
+
         :return: (row, col) unde se afla regele
         :raises ValueError: daca regele nu este gasit pe tabla
         """
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece.piece_type == PieceType.KING and piece.color == color:
-                    return row, col
-        raise ValueError(f"King not found for {color}")
+        king = self.kings[color]
+        if king is None:
+            raise ValueError(f"King not found for {color}")
+        return king
 
     def get_positions_of_color(self, color):
         """
         Returneaza toate pozitiile pieselor unei culori.
 
+        Pozitiile sunt mentinute incremental de set_piece; se intoarce
+        o lista noua, deci tabla poate fi modificata in timpul parcurgerii.
+
         :return: lista de tuple (row, col)
         """
-        positions = []
-        for r in range(8):
-            for c in range(8):
-                piece = self.get_piece(r, c)
-                if piece and piece.color == color:
-                    positions.append((r, c))
-        return positions
+        return list(self.positions[color])
 
     def _attack_squares(self, row, col):
         """
@@ -145,27 +265,10 @@ class Board:
             return out
 
         if pt == PieceType.KNIGHT:
-            out = []
-            offsets = [
-                (2, 1), (2, -1), (-2, 1), (-2, -1),
-                (1, 2), (1, -2), (-1, 2), (-1, -2),
-            ]
-            for dr, dc in offsets:
-                r, c = row + dr, col + dc
-                if self.in_bounds(r, c):
-                    out.append((r, c))
-            return out
+            return list(KNIGHT_TABLE[row][col])
 
         if pt == PieceType.KING:
-            out = []
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    r, c = row + dr, col + dc
-                    if self.in_bounds(r, c):
-                        out.append((r, c))
-            return out
+            return list(KING_TABLE[row][col])
 
         directions = []
         if pt == PieceType.ROOK:
@@ -193,16 +296,108 @@ class Board:
         """
         Verifica daca un patrat (row, col) este atacat de o anumita culoare.
 
+        Cautarea pleaca de la patratul tinta, folosind tabelele precalculate:
+        - cai pe patratele de salt ale calului
+        - pioni pe patratele de pe care ar putea captura
+        - rege pe patratele vecine
+        - tura/regina pe razele ortogonale, nebun/regina pe cele diagonale
+          (fiecare raza se opreste la prima piesa intalnita)
+
+        Se opreste la primul atacator gasit.
+
         :return: True daca exista cel putin o piesa a culorii by_color care ataca patratul
         """
-        for r in range(8):
-            for c in range(8):
-                piece = self.get_piece(r, c)
-                if piece and piece.color == by_color:
-                    if (row, col) in self._attack_squares(r, c):
-                        return True
+        grid = self.grid
+
+        for r, c in KNIGHT_TABLE[row][col]:
+            piece = grid[r][c]
+            if piece is not None and piece.color == by_color and piece.piece_type == PieceType.KNIGHT:
+                return True
+
+        for r, c in PAWN_ATTACKERS[by_color][row][col]:
+            piece = grid[r][c]
+            if piece is not None and piece.color == by_color and piece.piece_type == PieceType.PAWN:
+                return True
+
+        for r, c in KING_TABLE[row][col]:
+            piece = grid[r][c]
+            if piece is not None and piece.color == by_color and piece.piece_type == PieceType.KING:
+                return True
+
+        for ray in ROOK_RAYS[row][col]:
+            for r, c in ray:
+                piece = grid[r][c]
+                if piece is None:
+                    continue
+                if piece.color == by_color and piece.piece_type in (PieceType.ROOK, PieceType.QUEEN):
+                    return True
+                break
+
+        for ray in BISHOP_RAYS[row][col]:
+            for r, c in ray:
+                piece = grid[r][c]
+                if piece is None:
+                    continue
+                if piece.color == by_color and piece.piece_type in (PieceType.BISHOP, PieceType.QUEEN):
+                    return True
+                break
+
         return False
 
+    def checkers_and_pins(self, color, king_pos):
+        """
+        Calculeaza, o singura data pe pozitie, piesele care dau sah
+        regelui culorii color si piesele proprii legate (pinned).
+
+        Se pleaca de la rege pe razele ortogonale si diagonale si pe
+        patratele de cal si de pion.
+
+        :param color: culoarea regelui
+        :param king_pos: pozitia (row, col) a regelui
+        :return: tuplu (checkers, block_squares, pins):
+                 - checkers: numarul de piese care dau sah
+                 - block_squares: patratele pe care o piesa poate para sahul
+                   (capturarea atacatorului sau interpunere), sau None fara sah
+                 - pins: dictionar {pozitie piesa legata: patratele pe care
+                   se poate misca fara sa descopere regele}
+        """
+        grid = self.grid
+        kr, kc = king_pos
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+        checkers = 0
+        block_squares = None
+        pins = {}
+
+        for rays, sliders in ((ROOK_RAYS[kr][kc], ROOK_SLIDERS), (BISHOP_RAYS[kr][kc], BISHOP_SLIDERS)):
+            for ray in rays:
+                own = None
+                for i, (r, c) in enumerate(ray):
+                    piece = grid[r][c]
+                    if piece is None:
+                        continue
+                    if piece.color == color:
+                        if own is not None:
+                            break
+                        own = (r, c)
+                        continue
+                    if piece.piece_type in sliders:
+                        line = set(ray[:i + 1])
+                        if own is None:
+                            checkers += 1
+                            block_squares = line
+                        else:
+                            pins[own] = line
+                    break
+
+        for table, ptype in ((KNIGHT_TABLE[kr][kc], PieceType.KNIGHT), (PAWN_ATTACKERS[enemy][kr][kc], PieceType.PAWN)):
+            for r, c in table:
+                piece = grid[r][c]
+                if piece is not None and piece.color == enemy and piece.piece_type == ptype:
+                    checkers += 1
+                    block_squares = {(r, c)}
+
+        return checkers, block_squares, pins
+
     def __str__(self):
         """
         Returneaza o reprezentare ASCII a tablei pentru debug.
@@ -297,15 +492,10 @@ class Board:
         piece = self.get_piece(row, col)
         color = piece.color
         moves = []
-        offsets = [
-            (2, 1), (2, -1), (-2, 1), (-2, -1),
-            (1, 2), (1, -2), (-1, 2), (-1, -2),
-        ]
-        for d_row, d_col in offsets:
-            r, c = row + d_row, col + d_col
-            if self.in_bounds(r, c):
-                if self.is_empty(r, c) or self.is_enemy(r, c, color):
-                    moves.append((r, c))
+        for r, c in KNIGHT_TABLE[row][col]:
+            target = self.grid[r][c]
+            if target is None or target.color != color:
+                moves.append((r, c))
         return moves
 
     def _king_moves(self, row, col):
@@ -316,14 +506,10 @@ class Board:
         piece = self.get_piece(row, col)
         color = piece.color
         moves = []
-        for d_row in (-1, 0, 1):
-            for d_col in (-1, 0, 1):
-                if d_row == 0 and d_col == 0:
-                    continue
-                r, c = row + d_row, col + d_col
-                if self.in_bounds(r, c):
-                    if self.is_empty(r, c) or self.is_enemy(r, c, color):
-                        moves.append((r, c))
+        for r, c in KING_TABLE[row][col]:
+            target = self.grid[r][c]
+            if target is None or target.color != color:
+                moves.append((r, c))
         return moves
 
     def _pawn_moves(self, row, col, color):
@@ -0,0 +1,157 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+DEFAULT_SQUARE_SIZE = 64
+"""
+Latura initiala a unui patrat, in pixeli.
+"""
+
+MIN_SQUARE_SIZE = 16
+"""
+Latura minima a unui patrat la redimensionarea ferestrei.
+"""
+
+PIECE_SCALE = 0.75
+"""
+Inaltimea simbolului unei piese, ca fractiune din latura patratului.
+"""
+
+
+class CanvasBoard:
+    """
+    Tabla de sah desenata pe un singur tk.Canvas (in loc de 64 de butoane).
+
+    - patratele sunt desenate o singura data, ca dreptunghiuri; la schimbarea
+      selectiei se schimba doar culoarea celor afectate
+    - fiecare piesa este un element de tip text (simbolul Unicode) care, la o
+      mutare, este doar mutat pe canvas, nu sters si recreat
+    - toate piesele folosesc un singur font, creat o data; la redimensionare
+      i se schimba doar dimensiunea, iar Tk actualizeaza elementele care il folosesc
+    - la redimensionare se recalculeaza doar coordonatele elementelor
+
+    Randul 0 (rangul 1) este desenat jos, ca in interfata cu butoane.
+    """
+
+    def __init__(self, parent, on_click, square_size: int = DEFAULT_SQUARE_SIZE):
+        """
+        :param parent: widget-ul parinte
+        :param on_click: functie apelata cu (row, col) la click pe un patrat
+        :param square_size: latura initiala a unui patrat, in pixeli
+        """
+        self.on_click = on_click
+        self.square_size = square_size
+        self.canvas = tk.Canvas(
+            parent, width=8 * square_size, height=8 * square_size, highlightthickness=0, borderwidth=0
+        )
+        self.font = tkfont.Font(family="Arial", size=self._font_size(square_size))
+        self.colors = [[None for _ in range(8)] for _ in range(8)]
+        self.pieces = {}
+
+        self.squares = [[None for _ in range(8)] for _ in range(8)]
+        for r in range(8):
+            for c in range(8):
+                self.squares[r][c] = self.canvas.create_rectangle(*self._square_bbox(r, c), width=0)
+
+        self.canvas.bind("<Button-1>", self._on_button)
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    def pack(self, **kwargs):
+        """
+        Aseaza canvas-ul in parinte (ca tk.Widget.pack).
+        """
+        self.canvas.pack(**kwargs)
+
+    @staticmethod
+    def _font_size(square_size: int) -> int:
+        """
+        Returneaza dimensiunea fontului pieselor (negativa = in pixeli)
+        pentru o anumita latura a patratului.
+        """
+        return -max(1, int(square_size * PIECE_SCALE))
+
+    def _square_bbox(self, r, c):
+        """
+        Returneaza coordonatele (x0, y0, x1, y1) ale patratului (r, c).
+        """
+        size = self.square_size
+        x0 = c * size
+        y0 = (7 - r) * size
+        return x0, y0, x0 + size, y0 + size
+
+    def _square_center(self, r, c):
+        """
+        Returneaza coordonatele centrului patratului (r, c).
+        """
+        size = self.square_size
+        return c * size + size / 2, (7 - r) * size + size / 2
+
+    def render(self, states):
+        """
+        Actualizeaza tabla dupa starea dorita a fiecarui patrat.
+
+        Se schimba doar culorile diferite de cele afisate; piesele care
+        au disparut de pe un patrat si au aparut pe altul sunt mutate.
+
+        :param states: matrice 8x8 cu (text piesa sau "", culoare de fundal)
+        """
+        canvas = self.canvas
+        wanted = {}
+        for r in range(8):
+            for c in range(8):
+                text, bg = states[r][c]
+                if self.colors[r][c] != bg:
+                    canvas.itemconfigure(self.squares[r][c], fill=bg)
+                    self.colors[r][c] = bg
+                if text:
+                    wanted[(r, c)] = text
+
+        removed = {}
+        for pos, (item, text) in list(self.pieces.items()):
+            if wanted.get(pos) != text:
+                removed.setdefault(text, []).append(item)
+                del self.pieces[pos]
+
+        font = self.font
+        for pos, text in wanted.items():
+            if pos in self.pieces:
+                continue
+            x, y = self._square_center(*pos)
+            items = removed.get(text)
+            if items:
+                item = items.pop()
+                canvas.coords(item, x, y)
+            else:
+                item = canvas.create_text(x, y, text=text, font=font, tags=("piece",))
+            self.pieces[pos] = (item, text)
+
+        for items in removed.values():
+            for item in items:
+                canvas.delete(item)
+
+    def _on_button(self, event):
+        """
+        Converteste un click pe canvas in (row, col) si apeleaza on_click.
+        """
+        c = int(event.x // self.square_size)
+        r = 7 - int(event.y // self.square_size)
+        if 0 <= r < 8 and 0 <= c < 8:
+            self.on_click(r, c)
+
+    def _on_resize(self, event):
+        """
+        La redimensionarea canvas-ului, recalculeaza latura patratelor si
+        muta/scaleaza elementele existente.
+        """
+        size = max(MIN_SQUARE_SIZE, min(event.width, event.height) // 8)
+        if size == self.square_size:
+            return
+        self.square_size = size
+
+        canvas = self.canvas
+        for r in range(8):
+            for c in range(8):
+                canvas.coords(self.squares[r][c], *self._square_bbox(r, c))
+        for (r, c), (item, _text) in self.pieces.items():
+            canvas.coords(item, *self._square_center(r, c))
+        self.font.configure(size=self._font_size(size))
@@ -0,0 +1,187 @@
+from pieces import Color, PieceType
+
+
+PIECE_VALUE = {
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 20000,
+}
+"""
+Dictionar care asociaza fiecarei piese o valoare numerica.
+
+Valorile sunt folosite pentru evaluarea materialului pe tabla:
+- valori pozitive favorizeaza albul
+- valori negative favorizeaza negrul (aplicate ulterior)
+"""
+
+PHASE_WEIGHT = {
+    PieceType.PAWN: 0,
+    PieceType.KNIGHT: 1,
+    PieceType.BISHOP: 1,
+    PieceType.ROOK: 2,
+    PieceType.QUEEN: 4,
+    PieceType.KING: 0,
+}
+MAX_PHASE = 24
+"""
+Faza jocului: suma ponderilor pieselor ramase (24 = toate piesele pe tabla,
+0 = doar regi si pioni). Evaluarea trece treptat de la tabelele de deschidere
+la cele de final pe masura ce faza scade.
+"""
+
+# Tabelele sunt scrise din perspectiva albului, cu rangul 8 pe primul rand
+# (asa cum se vede tabla), si sunt convertite mai jos la indexul row * 8 + col.
+
+_PAWN_MG = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]
+
+_PAWN_EG = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    80, 80, 80, 80, 80, 80, 80, 80,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    30, 30, 30, 30, 30, 30, 30, 30,
+    20, 20, 20, 20, 20, 20, 20, 20,
+    10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]
+
+_KNIGHT = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]
+
+_BISHOP = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]
+
+_ROOK = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+]
+
+_QUEEN = [
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+]
+
+_KING_MG = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+]
+
+_KING_EG = [
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+]
+
+_TABLES = {
+    PieceType.PAWN: (_PAWN_MG, _PAWN_EG),
+    PieceType.KNIGHT: (_KNIGHT, _KNIGHT),
+    PieceType.BISHOP: (_BISHOP, _BISHOP),
+    PieceType.ROOK: (_ROOK, _ROOK),
+    PieceType.QUEEN: (_QUEEN, _QUEEN),
+    PieceType.KING: (_KING_MG, _KING_EG),
+}
+
+
+def _square_scores(color, ptype, phase_index):
+    """
+    Construieste lista de 64 de scoruri (material + tabela) pentru o piesa,
+    indexata cu row * 8 + col, cu semn pozitiv pentru alb si negativ pentru negru.
+    """
+    table = _TABLES[ptype][phase_index]
+    value = PIECE_VALUE[ptype]
+    out = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        if color == Color.WHITE:
+            out.append(value + table[(7 - row) * 8 + col])
+        else:
+            out.append(-(value + table[row * 8 + col]))
+    return out
+
+
+MG_SCORES = {color: {ptype: _square_scores(color, ptype, 0) for ptype in PieceType} for color in Color}
+EG_SCORES = {color: {ptype: _square_scores(color, ptype, 1) for ptype in PieceType} for color in Color}
+"""
+Scorul (material + pozitie) al fiecarei piese pe fiecare patrat,
+pentru deschidere/mijlocul jocului (MG) si pentru final (EG).
+"""
+
+
+def compute_eval_state(board):
+    """
+    Calculeaza de la zero componentele evaluarii pentru o tabla.
+
+    :return: tuplu (mg, eg, phase)
+    """
+    mg = 0
+    eg = 0
+    phase = 0
+    for color in Color:
+        for row, col in board.get_positions_of_color(color):
+            ptype = board.get_piece(row, col).piece_type
+            sq = row * 8 + col
+            mg += MG_SCORES[color][ptype][sq]
+            eg += EG_SCORES[color][ptype][sq]
+            phase += PHASE_WEIGHT[ptype]
+    return mg, eg, phase
+
+
+def tapered_score(mg: int, eg: int, phase: int) -> int:
+    """
+    Combina scorurile de deschidere si de final in functie de faza jocului.
+
+    :return: scorul pozitiei (pozitiv favorizeaza albul)
+    """
+    phase = min(phase, MAX_PHASE)
+    return (mg * phase + eg * (MAX_PHASE - phase)) // MAX_PHASE
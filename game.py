@@ -1,5 +1,26 @@
-from board import Board
+from bitboard import BitboardBoard
 from pieces import Color, PieceType, Piece
+from evaluation import MG_SCORES, EG_SCORES, PHASE_WEIGHT, compute_eval_state, tapered_score
+from zobrist import PIECE_KEYS, SIDE_KEY, CASTLE_KEYS, EP_FILE_KEYS, castle_rights_tuple, compute_hash
+
+
+PROMOTION_TYPES = (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT)
+"""
+Tipurile de piese in care poate fi promovat un pion, in ordinea preferintei.
+"""
+
+CASTLE_RIGHT_SQUARES = {
+    (0, 4): ((Color.WHITE, "K"), (Color.WHITE, "Q")),
+    (0, 7): ((Color.WHITE, "K"),),
+    (0, 0): ((Color.WHITE, "Q"),),
+    (7, 4): ((Color.BLACK, "K"), (Color.BLACK, "Q")),
+    (7, 7): ((Color.BLACK, "K"),),
+    (7, 0): ((Color.BLACK, "Q"),),
+}
+"""
+Patratele initiale ale regilor si turelor si drepturile de rocada
+care se pierd cand o piesa pleaca de pe ele sau este capturata acolo.
+"""
 
 
 class Move:
@@ -51,13 +72,19 @@ class ChessGame:
     - reguli speciale
     - check, checkmate, stalemate
     - istoric mutari
+    - cheia Zobrist a pozitiei (zobrist_key) si evaluarea statica,
+      actualizate incremental
     """
 
-    def __init__(self):
+    def __init__(self, board=None):
         """
         Initializeaza un joc nou de sah.
+
+        :param board: tabla folosita de joc (Board sau BitboardBoard);
+                      implicit se creeaza un BitboardBoard nou (mai rapid)
+                      in pozitia initiala
         """
-        self.board = Board()
+        self.board = board if board is not None else BitboardBoard()
         self.current_player = Color.WHITE
         self.history = []
         self.en_passant_target = None
@@ -65,6 +92,28 @@ class ChessGame:
             Color.WHITE: {"K": True, "Q": True},
             Color.BLACK: {"K": True, "Q": True},
         }
+        self._reset_position_state()
+
+    def _reset_position_state(self):
+        """
+        Recalculeaza de la zero starea derivata din pozitie:
+        cheia Zobrist, componentele evaluarii si cache-ul de status.
+        """
+        self.zobrist_key = compute_hash(self)
+        self.eval_mg, self.eval_eg, self.phase = compute_eval_state(self.board)
+        self._status_cache = None
+
+    def evaluate(self) -> int:
+        """
+        Returneaza evaluarea statica a pozitiei, in O(1).
+
+        Evaluarea (material din PIECE_VALUE + tabele piesa-patrat pentru
+        deschidere si final, ponderate dupa faza jocului) este mentinuta
+        incremental de make_move/unmake_move.
+
+        :return: scor (pozitiv favorizeaza albul)
+        """
+        return tapered_score(self.eval_mg, self.eval_eg, self.phase)
 
     @staticmethod
     def algebraic_to_coords(square: str):
@@ -88,6 +137,127 @@ class ChessGame:
         rank = str(row + 1)
         return file + rank
 
+    @staticmethod
+    def move_to_algebraic(move):
+        """
+        Converteste o mutare (from_pos, to_pos, promotion) in notatie algebraica.
+
+        :return: tuplu (from_square, to_square), ex: ("e2", "e4") sau ("e7", "e8Q")
+        """
+        from_pos, to_pos, promotion = move
+        from_alg = ChessGame.coords_to_algebraic(from_pos[0], from_pos[1])
+        to_alg = ChessGame.coords_to_algebraic(to_pos[0], to_pos[1])
+        if promotion is not None:
+            to_alg = to_alg + promotion.value
+        return from_alg, to_alg
+
+    def load_fen(self, fen: str):
+        """
+        Seteaza pozitia jocului dintr-un sir FEN.
+
+        Sunt folosite primele patru campuri (piese, jucator la mutare,
+        drepturi de rocada, en passant); contoarele de mutari sunt ignorate.
+        Istoricul este golit.
+
+        :raises ValueError: daca sirul FEN nu este valid (inclusiv drepturi de
+                            rocada in afara de KQkq, un camp en passant care nu
+                            este pe rangul 3 sau 6, alt numar de regi decat
+                            unul pentru fiecare culoare, sau regele jucatorului
+                            care nu este la mutare in sah)
+        """
+        parts = fen.split()
+        if len(parts) < 4:
+            raise ValueError("Invalid FEN")
+        placement, side, castling, en_passant = parts[:4]
+
+        ranks = placement.split("/")
+        if len(ranks) != 8:
+            raise ValueError("Invalid FEN")
+        if side not in ("w", "b"):
+            raise ValueError("Invalid FEN")
+        if castling != "-" and (not castling or any(ch not in "KQkq" for ch in castling)):
+            raise ValueError("Invalid FEN")
+        if en_passant != "-" and (
+            len(en_passant) != 2 or en_passant[0] not in "abcdefgh" or en_passant[1] not in "36"
+        ):
+            raise ValueError("Invalid FEN")
+
+        self.board.clear()
+        kings = {Color.WHITE: 0, Color.BLACK: 0}
+        for i, rank in enumerate(ranks):
+            row = 7 - i
+            col = 0
+            for ch in rank:
+                if ch.isdigit():
+                    col += int(ch)
+                    continue
+                if col > 7 or ch.upper() not in "KQRBNP":
+                    raise ValueError("Invalid FEN")
+                color = Color.WHITE if ch.isupper() else Color.BLACK
+                if ch.upper() == "K":
+                    kings[color] += 1
+                self.board.set_piece(row, col, Piece(PieceType(ch.upper()), color))
+                col += 1
+            if col != 8:
+                raise ValueError("Invalid FEN")
+        if kings[Color.WHITE] != 1 or kings[Color.BLACK] != 1:
+            raise ValueError("Invalid FEN: each side needs exactly one king")
+
+        self.current_player = Color.WHITE if side == "w" else Color.BLACK
+        waiting = Color.BLACK if self.current_player == Color.WHITE else Color.WHITE
+        if self.is_in_check(waiting):
+            raise ValueError("Invalid FEN: the side not to move is in check")
+        self.castle_rights = {
+            Color.WHITE: {"K": "K" in castling, "Q": "Q" in castling},
+            Color.BLACK: {"K": "k" in castling, "Q": "q" in castling},
+        }
+        self.en_passant_target = None if en_passant == "-" else self.algebraic_to_coords(en_passant)
+        self.history = []
+        self._reset_position_state()
+
+    @classmethod
+    def from_fen(cls, fen: str, board=None):
+        """
+        Creeaza un joc nou pornind de la o pozitie FEN.
+
+        :param board: tabla folosita (Board sau BitboardBoard), optional
+        """
+        game = cls(board)
+        game.load_fen(fen)
+        return game
+
+    def to_fen(self) -> str:
+        """
+        Returneaza pozitia curenta ca sir FEN.
+        """
+        ranks = []
+        for row in range(7, -1, -1):
+            out = ""
+            empty = 0
+            for col in range(8):
+                piece = self.board.get_piece(row, col)
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    out += str(empty)
+                    empty = 0
+                out += piece.symbol
+            if empty:
+                out += str(empty)
+            ranks.append(out)
+
+        castling = ""
+        for color, letters in ((Color.WHITE, "KQ"), (Color.BLACK, "kq")):
+            for side, letter in zip(("K", "Q"), letters):
+                if self.castle_rights[color][side]:
+                    castling += letter
+
+        side = "w" if self.current_player == Color.WHITE else "b"
+        ep = "-" if self.en_passant_target is None else self.coords_to_algebraic(*self.en_passant_target)
+        fullmove = len(self.history) // 2 + 1
+        return f"{'/'.join(ranks)} {side} {castling or '-'} {ep} 0 {fullmove}"
+
     def is_in_check(self, color: Color) -> bool:
         """
         Verifica daca regele unei culori este in sah.
@@ -189,11 +359,430 @@ class ChessGame:
         """
         Returneaza starea jocului pentru o culoare:
         normal, check, checkmate sau stalemate.
+
+        Starea se calculeaza cu un singur test de sah si o singura
+        verificare de existenta a unei mutari legale, apoi este memorata
+        pana cand pozitia se schimba (mutare, unmake, restore, FEN).
         """
-        if self.is_checkmate(color):
-            return "checkmate"
-        if self.is_stalemate(color):
-            return "stalemate"
-        if self.is_in_check(color):
-            return "check"
-        return "normal"
+        cache_key = (self.zobrist_key, color)
+        if self._status_cache is not None and self._status_cache[0] == cache_key:
+            return self._status_cache[1]
+
+        in_check = self.is_in_check(color)
+        if self.has_any_legal_moves(color):
+            status = "check" if in_check else "normal"
+        else:
+            status = "checkmate" if in_check else "stalemate"
+
+        self._status_cache = (cache_key, status)
+        return status
+
+    def is_checkmate(self, color: Color) -> bool:
+        """
+        Verifica daca o culoare este in sah mat
+        (regele este in sah si nu exista mutari legale).
+        """
+        return self.get_status_for(color) == "checkmate"
+
+    def is_stalemate(self, color: Color) -> bool:
+        """
+        Verifica daca o culoare este in pat
+        (regele nu este in sah, dar nu exista mutari legale).
+        """
+        return self.get_status_for(color) == "stalemate"
+
+    def _is_legal_after_king_safety(self, from_pos, to_pos, color: Color, en_passant=False) -> bool:
+        """
+        Simuleaza mutarea pe tabla si verifica daca regele
+        culorii care muta ramane in afara sahului.
+
+        Tabla este readusa la starea initiala dupa verificare.
+        """
+        fr, fc = from_pos
+        tr, tc = to_pos
+        piece = self.board.get_piece(fr, fc)
+        captured = self.board.get_piece(tr, tc)
+        ep_piece = None
+        if en_passant:
+            ep_piece = self.board.get_piece(fr, tc)
+            self.board.set_piece(fr, tc, None)
+
+        self.board.set_piece(tr, tc, piece)
+        self.board.set_piece(fr, fc, None)
+        try:
+            return not self.is_in_check(color)
+        finally:
+            self.board.set_piece(fr, fc, piece)
+            self.board.set_piece(tr, tc, captured)
+            if en_passant:
+                self.board.set_piece(fr, tc, ep_piece)
+
+    def get_all_legal_moves(self, color: Color):
+        """
+        Genereaza toate mutarile legale pentru o culoare.
+
+        Include en passant, rocada si promovarile (cate o mutare
+        pentru fiecare piesa in care se poate promova).
+
+        :return: lista de tuple (from_pos, to_pos, promotion)
+                 unde promotion este un PieceType sau None
+        """
+        return list(self._iter_legal_moves(color))
+
+    def get_capture_moves(self, color: Color):
+        """
+        Genereaza doar mutarile legale "zgomotoase": capturi
+        (inclusiv en passant) si promovari. Folosita de cautarea de quiescence.
+
+        :return: lista de tuple (from_pos, to_pos, promotion)
+        """
+        return list(self._iter_legal_moves(color, captures_only=True))
+
+    def has_any_legal_moves(self, color: Color) -> bool:
+        """
+        Verifica daca o culoare are cel putin o mutare legala.
+
+        Generarea se opreste la prima mutare gasita.
+        """
+        for _move in self._iter_legal_moves(color):
+            return True
+        return False
+
+    def _iter_legal_moves(self, color: Color, captures_only=False):
+        """
+        Genereaza (lazy) mutarile legale pentru o culoare.
+        Cu captures_only=True se emit doar capturile si promovarile.
+
+        Sahurile si piesele legate sunt calculate o singura data, apoi
+        se emit direct doar mutarile legale:
+        - regele nu poate merge pe patrate atacate
+        - la sah dublu se genereaza doar mutari de rege
+        - la sah simplu celelalte piese pot doar captura atacatorul sau interpune
+        - piesele legate se misca doar pe linia dintre rege si atacator
+
+        Tabla nu este modificata intre doua mutari emise, deci
+        parcurgerea poate fi oprita oricand.
+        """
+        board = self.board
+        promo_row = 7 if color == Color.WHITE else 0
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+
+        king_pos = board.find_king(color)
+        kr, kc = king_pos
+        checkers, block_squares, pins = board.checkers_and_pins(color, king_pos)
+
+        king_moves = []
+        king_targets = board.get_legal_moves(kr, kc)
+        king = board.get_piece(kr, kc)
+        board.set_piece(kr, kc, None)
+        try:
+            for (tr, tc) in king_targets:
+                if captures_only and board.is_empty(tr, tc):
+                    continue
+                if not board.is_square_attacked(tr, tc, enemy):
+                    king_moves.append((king_pos, (tr, tc), None))
+        finally:
+            board.set_piece(kr, kc, king)
+
+        yield from king_moves
+
+        if checkers > 1:
+            return
+
+        for (fr, fc) in board.get_positions_of_color(color):
+            if (fr, fc) == king_pos:
+                continue
+            piece = board.get_piece(fr, fc)
+            is_pawn = piece.piece_type == PieceType.PAWN
+            pin_line = pins.get((fr, fc))
+
+            for (tr, tc) in board.get_legal_moves(fr, fc):
+                if pin_line is not None and (tr, tc) not in pin_line:
+                    continue
+                if block_squares is not None and (tr, tc) not in block_squares:
+                    continue
+                if captures_only and board.is_empty(tr, tc) and not (is_pawn and tr == promo_row):
+                    continue
+                if is_pawn and tr == promo_row:
+                    for promo in PROMOTION_TYPES:
+                        yield (fr, fc), (tr, tc), promo
+                else:
+                    yield (fr, fc), (tr, tc), None
+
+            if is_pawn and color == self.current_player:
+                for (tr, tc) in self._en_passant_moves_for_pawn(fr, fc, color):
+                    if self._is_legal_after_king_safety((fr, fc), (tr, tc), color, en_passant=True):
+                        yield (fr, fc), (tr, tc), None
+
+        if checkers == 0 and not captures_only:
+            for (king_from, king_to, _rook_from, _rook_to) in self._castling_moves_for(color):
+                yield king_from, king_to, None
+
+    def _update_castle_rights(self, from_pos, to_pos):
+        """
+        Actualizeaza drepturile de rocada dupa o mutare:
+        - daca regele s-a mutat, pierde ambele drepturi
+        - daca o tura a plecat sau a fost capturata pe patratul initial,
+          se pierde dreptul pentru partea respectiva
+        """
+        for square in (from_pos, to_pos):
+            for color, side in CASTLE_RIGHT_SQUARES.get(square, ()):
+                self.castle_rights[color][side] = False
+
+    def make_move(self, move):
+        """
+        Aplica pe tabla o mutare generata de get_all_legal_moves.
+
+        Mutarea nu este validata si nu este adaugata in istoric;
+        este varianta rapida folosita in cautare, impreuna cu unmake_move.
+        Cheia Zobrist si evaluarea sunt actualizate incremental.
+
+        :param move: tuplu (from_pos, to_pos, promotion)
+        :return: inregistrare de undo (tuplu) pentru unmake_move
+        """
+        from_pos, to_pos, promotion = move
+        fr, fc = from_pos
+        tr, tc = to_pos
+        board = self.board
+        color = self.current_player
+        piece = board.get_piece(fr, fc)
+        captured = board.get_piece(tr, tc)
+        capture_pos = to_pos
+        rook_move = None
+        prev_key = self.zobrist_key
+        keys = PIECE_KEYS[color]
+        key = prev_key ^ SIDE_KEY ^ keys[piece.piece_type][fr * 8 + fc]
+        prev_eval = (self.eval_mg, self.eval_eg, self.phase)
+        mg_scores = MG_SCORES[color]
+        eg_scores = EG_SCORES[color]
+        mg = self.eval_mg - mg_scores[piece.piece_type][fr * 8 + fc]
+        eg = self.eval_eg - eg_scores[piece.piece_type][fr * 8 + fc]
+        phase = self.phase
+
+        if piece.piece_type == PieceType.PAWN:
+            if fc != tc and captured is None:
+                capture_pos = (fr, tc)
+                captured = board.get_piece(fr, tc)
+                board.set_piece(fr, tc, None)
+        elif piece.piece_type == PieceType.KING and abs(tc - fc) == 2:
+            rook_from = (fr, 7) if tc > fc else (fr, 0)
+            rook_to = (fr, 5) if tc > fc else (fr, 3)
+            rook = board.get_piece(rook_from[0], rook_from[1])
+            board.set_piece(rook_from[0], rook_from[1], None)
+            board.set_piece(rook_to[0], rook_to[1], rook)
+            rook_move = (rook_from, rook_to)
+            rook_from_sq = fr * 8 + rook_from[1]
+            rook_to_sq = fr * 8 + rook_to[1]
+            rook_keys = keys[PieceType.ROOK]
+            key ^= rook_keys[rook_from_sq] ^ rook_keys[rook_to_sq]
+            rook_mg = mg_scores[PieceType.ROOK]
+            rook_eg = eg_scores[PieceType.ROOK]
+            mg += rook_mg[rook_to_sq] - rook_mg[rook_from_sq]
+            eg += rook_eg[rook_to_sq] - rook_eg[rook_from_sq]
+
+        if captured is not None:
+            capture_sq = capture_pos[0] * 8 + capture_pos[1]
+            key ^= PIECE_KEYS[captured.color][captured.piece_type][capture_sq]
+            mg -= MG_SCORES[captured.color][captured.piece_type][capture_sq]
+            eg -= EG_SCORES[captured.color][captured.piece_type][capture_sq]
+            phase -= PHASE_WEIGHT[captured.piece_type]
+
+        placed_type = piece.piece_type if promotion is None else promotion
+        if promotion is None:
+            board.set_piece(tr, tc, piece)
+        else:
+            board.set_piece(tr, tc, Piece(promotion, color))
+            phase += PHASE_WEIGHT[promotion]
+        board.set_piece(fr, fc, None)
+        key ^= keys[placed_type][tr * 8 + tc]
+        self.eval_mg = mg + mg_scores[placed_type][tr * 8 + tc]
+        self.eval_eg = eg + eg_scores[placed_type][tr * 8 + tc]
+        self.phase = phase
+
+        prev_rights = castle_rights_tuple(self.castle_rights)
+        self._update_castle_rights(from_pos, to_pos)
+        new_rights = castle_rights_tuple(self.castle_rights)
+        if new_rights != prev_rights:
+            for before, after, castle_key in zip(prev_rights, new_rights, CASTLE_KEYS):
+                if before != after:
+                    key ^= castle_key
+
+        prev_ep = self.en_passant_target
+        if prev_ep is not None:
+            key ^= EP_FILE_KEYS[prev_ep[1]]
+        if piece.piece_type == PieceType.PAWN and abs(tr - fr) == 2:
+            self.en_passant_target = ((fr + tr) // 2, fc)
+            key ^= EP_FILE_KEYS[fc]
+        else:
+            self.en_passant_target = None
+
+        self.zobrist_key = key
+        self.current_player = Color.BLACK if color == Color.WHITE else Color.WHITE
+        return move, piece, captured, capture_pos, rook_move, prev_ep, prev_rights, prev_key, prev_eval
+
+    def unmake_move(self, undo):
+        """
+        Anuleaza o mutare aplicata cu make_move, in O(1).
+
+        :param undo: inregistrarea intoarsa de make_move
+        """
+        move, piece, captured, capture_pos, rook_move, prev_ep, prev_rights, prev_key, prev_eval = undo
+        (fr, fc), (tr, tc), _promotion = move
+        board = self.board
+
+        board.set_piece(tr, tc, None)
+        board.set_piece(fr, fc, piece)
+        if captured is not None:
+            board.set_piece(capture_pos[0], capture_pos[1], captured)
+        if rook_move is not None:
+            (rfr, rfc), (rtr, rtc) = rook_move
+            rook = board.get_piece(rtr, rtc)
+            board.set_piece(rtr, rtc, None)
+            board.set_piece(rfr, rfc, rook)
+
+        white_rights = self.castle_rights[Color.WHITE]
+        black_rights = self.castle_rights[Color.BLACK]
+        white_rights["K"], white_rights["Q"], black_rights["K"], black_rights["Q"] = prev_rights
+        self.en_passant_target = prev_ep
+        self.zobrist_key = prev_key
+        self.eval_mg, self.eval_eg, self.phase = prev_eval
+        self.current_player = piece.color
+
+    def make_null_move(self):
+        """
+        Paseaza randul fara a muta nicio piesa (null move), folosit de cautare
+        pentru null-move pruning. Nu trebuie apelata cand regele este in sah.
+
+        :return: inregistrare de undo pentru unmake_null_move
+        """
+        prev_ep = self.en_passant_target
+        prev_key = self.zobrist_key
+        key = prev_key ^ SIDE_KEY
+        if prev_ep is not None:
+            key ^= EP_FILE_KEYS[prev_ep[1]]
+        self.en_passant_target = None
+        self.zobrist_key = key
+        self.current_player = Color.BLACK if self.current_player == Color.WHITE else Color.WHITE
+        return prev_ep, prev_key
+
+    def unmake_null_move(self, undo):
+        """
+        Anuleaza un null move aplicat cu make_null_move.
+        """
+        self.en_passant_target, self.zobrist_key = undo
+        self.current_player = Color.BLACK if self.current_player == Color.WHITE else Color.WHITE
+
+    def play_move(self, move, validate=True):
+        """
+        Aplica o mutare data in coordonate si o adauga in istoric.
+
+        Este calea folosita pentru mutari deja generate (de exemplu de AI),
+        fara conversii in/din notatie algebraica. Cand mutarea provine direct
+        din get_all_legal_moves, validarea poate fi sarita cu validate=False.
+
+        :param move: tuplu (from_pos, to_pos, promotion)
+        :param validate: daca este True, verifica mutarea in lista mutarilor legale
+        :return: tuplu (in_check, status) pentru jucatorul care urmeaza la mutare
+        :raises ValueError: daca validate este True si mutarea nu este legala
+        """
+        if validate and move not in self.get_all_legal_moves(self.current_player):
+            raise ValueError("Illegal move")
+
+        from_pos, to_pos, promotion = move
+        _move, piece, captured, capture_pos, rook_move = self.make_move(move)[:5]
+
+        self.history.append(
+            Move(
+                self.coords_to_algebraic(from_pos[0], from_pos[1]),
+                self.coords_to_algebraic(to_pos[0], to_pos[1]),
+                piece,
+                captured=captured,
+                promotion=promotion.value if promotion is not None else None,
+                en_passant=capture_pos != to_pos,
+                castling=rook_move is not None,
+            )
+        )
+
+        status = self.get_status_for(self.current_player)
+        return status in ("check", "checkmate"), status
+
+    def move(self, from_square: str, to_square: str):
+        """
+        Aplica o mutare data in notatie algebraica.
+
+        Exemple: move("e2", "e4"), move("e7", "e8q") pentru promovare.
+        Daca promovarea nu este specificata, pionul devine regina.
+
+        :return: tuplu (in_check, status) pentru jucatorul care urmeaza la mutare
+        :raises ValueError: daca mutarea nu este legala
+        """
+        to_alg, promotion = self._parse_to_square(to_square)
+        fr, fc = self.algebraic_to_coords(from_square)
+        tr, tc = self.algebraic_to_coords(to_alg)
+        if not (self.board.in_bounds(fr, fc) and self.board.in_bounds(tr, tc)):
+            raise ValueError("Square out of board")
+
+        piece = self.board.get_piece(fr, fc)
+        if piece is None:
+            raise ValueError("No piece at start square")
+        if piece.color != self.current_player:
+            raise ValueError("Not your turn")
+
+        options = [
+            promo
+            for (fp, tp, promo) in self.get_all_legal_moves(self.current_player)
+            if fp == (fr, fc) and tp == (tr, tc)
+        ]
+        if not options:
+            raise ValueError("Illegal move")
+
+        if options[0] is None:
+            promotion = None
+        else:
+            if promotion is None:
+                promotion = PieceType.QUEEN
+            if promotion not in options:
+                raise ValueError("Invalid promotion")
+
+        return self.play_move(((fr, fc), (tr, tc), promotion), validate=False)
+
+    def snapshot(self):
+        """
+        Salveaza starea completa a jocului pentru a putea fi refacuta ulterior.
+
+        :return: dictionar cu tabla, jucatorul curent, istoricul,
+                 tinta en passant, drepturile de rocada, cheia Zobrist si evaluarea
+        """
+        return {
+            "board": self.board.copy(),
+            "current_player": self.current_player,
+            "history": list(self.history),
+            "en_passant_target": self.en_passant_target,
+            "castle_rights": {color: dict(rights) for color, rights in self.castle_rights.items()},
+            "zobrist_key": self.zobrist_key,
+            "eval": (self.eval_mg, self.eval_eg, self.phase),
+        }
+
+    def copy(self):
+        """
+        Returneaza o copie independenta a jocului (de exemplu pentru o cautare
+        care ruleaza in alt fir de executie, in timp ce jocul continua).
+
+        :return: instanta ChessGame noua, in aceeasi stare
+        """
+        other = ChessGame.__new__(ChessGame)
+        other.restore(self.snapshot())
+        return other
+
+    def restore(self, snap):
+        """
+        Reface starea jocului dintr-un snapshot creat cu snapshot().
+        """
+        self.board = snap["board"].copy()
+        self.current_player = snap["current_player"]
+        self.history = list(snap["history"])
+        self.en_passant_target = snap["en_passant_target"]
+        self.castle_rights = {color: dict(rights) for color, rights in snap["castle_rights"].items()}
+        self.zobrist_key = snap["zobrist_key"]
+        self.eval_mg, self.eval_eg, self.phase = snap["eval"]
+        self._status_cache = None
@@ -4,6 +4,8 @@ from tkinter import messagebox, filedialog
 from game import ChessGame
 from pieces import Color
 from ai import ChessAI
+from board_canvas import CanvasBoard
+from ponder import BackgroundSearch, Ponderer
 from pgn_tools import save_pgn_like, load_pgn_like
 
 
@@ -26,6 +28,11 @@ Dictionar care mapeaza simbolurile interne ale pieselor (K, q, etc.)
 catre simboluri Unicode pentru afisare in interfata grafica.
 """
 
+SEARCH_POLL_MS = 50
+"""
+La cate milisecunde verifica interfata daca s-a terminat cautarea AI-ului.
+"""
+
 
 class ChessGUI:
     """
@@ -38,18 +45,23 @@ class ChessGUI:
     - aplicarea mutarilor in engine (ChessGame)
     - afisarea statusului (check, checkmate, stalemate)
     - salvare/incarcare fisier (PGN-like)
-    - control AI (pornit/oprit, side, depth, mutare AI)
+    - control AI (pornit/oprit, side, depth, mutare AI, pondering)
     """
 
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, renderer: str = "buttons"):
         """
         Construieste interfata:
         - zona de status (Turn/Status/Mesaje)
-        - tabla 8x8 din butoane
+        - tabla 8x8 din butoane sau un singur canvas (CanvasBoard)
         - zona de control (New/Reset/Save/Load/AI)
 
         :param root: fereastra principala Tkinter
+        :param renderer: "buttons" (64 de butoane) sau "canvas" (redimensionabil)
+        :raises ValueError: daca renderer nu este recunoscut
         """
+        if renderer not in ("buttons", "canvas"):
+            raise ValueError("Unknown renderer")
+
         self.root = root
         self.root.title("Chess")
 
@@ -57,6 +69,7 @@ class ChessGUI:
 
         self.selected = None
         self.legal_map = {}
+        self.legal_key = None
         self.legal_targets = set()
 
         self.status_var = tk.StringVar()
@@ -66,6 +79,13 @@ class ChessGUI:
         self.ai_enabled = tk.BooleanVar(value=False)
         self.ai_side = tk.StringVar(value="BLACK")
         self.ai_depth = tk.IntVar(value=3)
+        self.ai_ponder = tk.BooleanVar(value=True)
+
+        self.ai = ChessAI(depth=self.ai_depth.get())
+        self.ponderer = Ponderer(self.ai)
+        self.search = None
+        self.search_game = None
+        self.thinking_var = tk.StringVar()
 
         top = tk.Frame(root)
         top.pack(side=tk.TOP, fill=tk.X)
@@ -73,27 +93,35 @@ class ChessGUI:
         tk.Label(top, textvariable=self.turn_var, anchor="w").pack(side=tk.LEFT, padx=8, pady=6)
         tk.Label(top, textvariable=self.status_var, anchor="w").pack(side=tk.LEFT, padx=8, pady=6)
         tk.Label(top, textvariable=self.info_var, anchor="w").pack(side=tk.LEFT, padx=8, pady=6)
+        tk.Label(top, textvariable=self.thinking_var, anchor="e").pack(side=tk.RIGHT, padx=8, pady=6)
+
+        control = tk.Frame(root)
+        control.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=6)
 
         board_frame = tk.Frame(root)
-        board_frame.pack(side=tk.TOP, padx=10, pady=10)
 
         self.buttons = [[None for _ in range(8)] for _ in range(8)]
+        self.square_state = [[None for _ in range(8)] for _ in range(8)]
+        self.canvas_board = None
 
-        for ui_r in range(8):
-            for c in range(8):
-                r = 7 - ui_r
-                btn = tk.Button(
-                    board_frame,
-                    width=4,
-                    height=2,
-                    font=("Arial", 20),
-                    command=lambda rr=r, cc=c: self.on_square_click(rr, cc),
-                )
-                btn.grid(row=ui_r, column=c, padx=0, pady=0, sticky="nsew")
-                self.buttons[r][c] = btn
-
-        control = tk.Frame(root)
-        control.pack(side=tk.TOP, fill=tk.X, padx=10, pady=6)
+        if renderer == "canvas":
+            board_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self.canvas_board = CanvasBoard(board_frame, self.on_square_click)
+            self.canvas_board.pack(fill=tk.BOTH, expand=True)
+        else:
+            board_frame.pack(side=tk.TOP, padx=10, pady=10)
+            for ui_r in range(8):
+                for c in range(8):
+                    r = 7 - ui_r
+                    btn = tk.Button(
+                        board_frame,
+                        width=4,
+                        height=2,
+                        font=("Arial", 20),
+                        command=lambda rr=r, cc=c: self.on_square_click(rr, cc),
+                    )
+                    btn.grid(row=ui_r, column=c, padx=0, pady=0, sticky="nsew")
+                    self.buttons[r][c] = btn
 
         tk.Button(control, text="New Game", command=self.new_game).pack(side=tk.LEFT)
         tk.Button(control, text="Reset Selection", command=self.reset_selection).pack(side=tk.LEFT, padx=8)
@@ -107,6 +135,8 @@ class ChessGUI:
         tk.Label(control, text="Depth").pack(side=tk.LEFT, padx=6)
         tk.OptionMenu(control, self.ai_depth, 1, 2, 3, 4).pack(side=tk.LEFT)
         tk.Button(control, text="AI Move", command=self.ai_move).pack(side=tk.LEFT, padx=8)
+        tk.Label(control, text="Ponder").pack(side=tk.LEFT, padx=6)
+        tk.Checkbutton(control, variable=self.ai_ponder, command=self.on_ponder_toggle).pack(side=tk.LEFT)
 
         self.refresh()
 
@@ -115,12 +145,24 @@ class ChessGUI:
         Este apelata cand se bifeaza/debifeaza AI-ul.
         Daca AI-ul este activ si este randul lui, poate muta automat.
         """
+        if not self.ai_enabled.get():
+            self.cancel_ai_search()
+            self.ponderer.stop()
         self.maybe_ai_autoplay()
 
+    def on_ponder_toggle(self):
+        """
+        Este apelata cand se bifeaza/debifeaza pondering-ul.
+        """
+        if not self.ai_ponder.get():
+            self.ponderer.stop()
+
     def new_game(self):
         """
         Reseteaza jocul complet la pozitia initiala.
         """
+        self.cancel_ai_search()
+        self.ponderer.stop()
         self.game = ChessGame()
         self.reset_selection()
         self.refresh()
@@ -130,7 +172,6 @@ class ChessGUI:
         Sterge selectia curenta si toate highlight-urile pentru mutari.
         """
         self.selected = None
-        self.legal_map = {}
         self.legal_targets = set()
         self.info_var.set("")
         self.refresh()
@@ -159,11 +200,14 @@ class ChessGUI:
 
     def refresh(self):
         """
-        Re-deseneaza intreaga interfata:
-        - recalculeaza mutarile legale
-        - actualizeaza textele Turn/Status
-        - actualizeaza piesele pe tabla
-        - aplica highlight pentru selectie si mutari legale
+        Actualizeaza interfata:
+        - mutarile legale (recalculate doar daca pozitia s-a schimbat)
+        - textele Turn/Status
+        - piesele si highlight-urile pentru selectie si mutari legale
+
+        Pentru fiecare patrat se tine minte ce afiseaza (text si culoare,
+        in square_state) si sunt reconfigurate doar patratele care se schimba.
+        Cu tabla pe canvas, starea dorita este trimisa lui CanvasBoard.render.
         """
         self.rebuild_legal_cache()
 
@@ -173,25 +217,28 @@ class ChessGUI:
         status = self.game.get_status_for(self.game.current_player)
         self.status_var.set(f"Status: {status}")
 
+        board = self.game.board
+        states = [[None for _ in range(8)] for _ in range(8)]
         for r in range(8):
             for c in range(8):
-                btn = self.buttons[r][c]
-                base = self.square_colors(r, c)
-                btn.configure(bg=base, activebackground=base)
-
-                piece = self.game.board.get_piece(r, c)
-                btn.configure(text=self.piece_to_text(piece))
-
-        if self.selected is not None:
-            sr, sc = self.selected
-            self.buttons[sr][sc].configure(bg="#BACA44", activebackground="#BACA44")
+                if (r, c) == self.selected:
+                    bg = "#BACA44"
+                elif self.selected is not None and (r, c) in self.legal_targets:
+                    bg = "#F6F669"
+                else:
+                    bg = self.square_colors(r, c)
+                states[r][c] = (self.piece_to_text(board.get_piece(r, c)), bg)
+
+        if self.canvas_board is not None:
+            self.canvas_board.render(states)
+            return
 
-        for (tr, tc) in self.legal_targets:
-            if self.selected is None:
-                continue
-            if (tr, tc) == self.selected:
-                continue
-            self.buttons[tr][tc].configure(bg="#F6F669", activebackground="#F6F669")
+        for r in range(8):
+            for c in range(8):
+                state = states[r][c]
+                if self.square_state[r][c] != state:
+                    self.buttons[r][c].configure(text=state[0], bg=state[1], activebackground=state[1])
+                    self.square_state[r][c] = state
 
     def rebuild_legal_cache(self):
         """
@@ -200,14 +247,18 @@ class ChessGUI:
         legal_map:
         - cheie: (from_row, from_col)
         - valoare: lista de (to_row, to_col) si promovare posibila
+        - este recalculat doar cand se schimba pozitia (cheia Zobrist)
 
         legal_targets:
         - set de patrate tinta pentru piesa selectata (pentru highlight)
         """
-        self.legal_map = {}
-        all_moves = self.game.get_all_legal_moves(self.game.current_player)
-        for (from_pos, to_pos, promo) in all_moves:
-            self.legal_map.setdefault(from_pos, []).append((to_pos, promo))
+        key = self.game.zobrist_key
+        if key != self.legal_key:
+            self.legal_map = {}
+            all_moves = self.game.get_all_legal_moves(self.game.current_player)
+            for (from_pos, to_pos, promo) in all_moves:
+                self.legal_map.setdefault(from_pos, []).append((to_pos, promo))
+            self.legal_key = key
 
         if self.selected is None:
             self.legal_targets = set()
@@ -279,12 +330,16 @@ class ChessGUI:
 
     def ai_move(self):
         """
-        Face o mutare pentru AI, daca:
+        Porneste cautarea unei mutari pentru AI, daca:
         - AI este activ
         - este randul AI-ului
         - jocul nu este terminat
+        - nu exista deja o cautare in curs
 
-        Alege mutarea cu minimax (ChessAI) si o aplica in engine.
+        Cautarea (ChessAI) ruleaza intr-un fir de executie separat, pe o copie
+        a jocului; interfata ramane activa si verifica rezultatul periodic
+        (poll_ai_search). Daca adversarul a jucat mutarea asteptata de
+        pondering, se continua cautarea facuta deja in fundal.
         """
         ai_color = self.current_ai_color()
         if ai_color is None:
@@ -295,16 +350,46 @@ class ChessGUI:
             return
         if self.game.get_status_for(self.game.current_player) in ("checkmate", "stalemate"):
             return
+        if self.search is not None:
+            return
+
+        depth = self.ai_depth.get()
+        search = self.ponderer.take(self.game, depth)
+        if search is None:
+            self.ai.depth = depth
+            search = BackgroundSearch(self.ai, self.game)
+        self.search = search
+        self.search_game = self.game
+        self.thinking_var.set("AI thinking...")
+        self.root.after(SEARCH_POLL_MS, self.poll_ai_search)
+
+    def poll_ai_search(self):
+        """
+        Verifica (din bucla Tkinter) daca s-a terminat cautarea AI-ului si,
+        daca da, aplica mutarea gasita in engine.
+
+        Rezultatul este ignorat daca intre timp jocul a fost inlocuit
+        (New Game / Load) sau pozitia s-a schimbat.
+        """
+        search = self.search
+        if search is None:
+            return
+        if not search.done():
+            self.root.after(SEARCH_POLL_MS, self.poll_ai_search)
+            return
+
+        self.search = None
+        self.thinking_var.set("")
+        if self.game is not self.search_game or self.game.zobrist_key != search.key:
+            return
 
-        ai = ChessAI(depth=self.ai_depth.get())
-        best = ai.choose_move(self.game)
+        best = search.result
         if best is None:
             self.info_var.set("AI has no moves")
             return
 
-        f, t = best
         try:
-            in_check, status = self.game.move(f, t)
+            in_check, status = self.game.play_move(best, validate=False)
             msg = ""
             if in_check:
                 msg = "Check"
@@ -318,11 +403,43 @@ class ChessGUI:
             if status in ("checkmate", "stalemate"):
                 messagebox.showinfo("Game Over", f"{status}")
             else:
+                self.start_pondering()
                 self.root.after(50, self.maybe_ai_autoplay)
         except Exception as e:
             self.info_var.set(str(e))
             self.refresh()
 
+    def cancel_ai_search(self):
+        """
+        Anuleaza cautarea AI-ului in curs (daca exista); rezultatul ei este ignorat.
+        """
+        if self.search is None:
+            return
+        self.search.cancel()
+        self.search = None
+        self.thinking_var.set("")
+
+    def close(self):
+        """
+        Opreste cautarile din fundal si inchide fereastra.
+        """
+        self.cancel_ai_search()
+        self.ponderer.stop()
+        self.ai.close()
+        self.root.destroy()
+
+    def start_pondering(self):
+        """
+        Porneste pondering-ul dupa o mutare a AI-ului, daca este activat
+        si adversarul este uman. Mutarea asteptata este cea memorata
+        in tabela de transpozitie pentru pozitia curenta.
+        """
+        ai_color = self.current_ai_color()
+        if not self.ai_ponder.get() or ai_color is None or self.game.current_player == ai_color:
+            return
+        predicted = self.ai.tt.best_move(self.game.zobrist_key)
+        self.ponderer.start(self.game, predicted)
+
     def save_game(self):
         """
         Deschide un dialog de salvare si scrie jocul curent intr-un fisier PGN-like.
@@ -344,6 +461,8 @@ class ChessGUI:
         if not path:
             return
         try:
+            self.cancel_ai_search()
+            self.ponderer.stop()
             self.game = load_pgn_like(path)
             self.reset_selection()
             self.refresh()
@@ -380,7 +499,6 @@ class ChessGUI:
             if piece.color != self.game.current_player:
                 return
             self.selected = (r, c)
-            self.rebuild_legal_cache()
             self.refresh()
             return
 
@@ -392,7 +510,6 @@ class ChessGUI:
 
         if piece is not None and piece.color == self.game.current_player:
             self.selected = (r, c)
-            self.rebuild_legal_cache()
             self.refresh()
             return
 
@@ -435,11 +552,14 @@ class ChessGUI:
             self.refresh()
 
 
-def run_gui():
+def run_gui(renderer: str = "buttons"):
     """
     Functie helper care porneste interfata grafica.
     Creeaza fereastra principala si intra in loop-ul Tkinter.
+
+    :param renderer: "buttons" sau "canvas" (vezi ChessGUI)
     """
     root = tk.Tk()
-    ChessGUI(root)
+    gui = ChessGUI(root, renderer)
+    root.protocol("WM_DELETE_WINDOW", gui.close)
     root.mainloop()
@@ -1,3 +1,34 @@
-from gui import run_gui
+import argparse
+import sys
 
-run_gui()
+
+def main(argv=None) -> int:
+    """
+    Punct de intrare al aplicatiei.
+
+    Implicit porneste interfata grafica. Cu --uci porneste motorul UCI
+    pe stdin/stdout, fara a importa tkinter (pentru servere fara ecran).
+
+    Exemple:
+        python main.py
+        python main.py --renderer canvas
+        python main.py --uci
+    """
+    parser = argparse.ArgumentParser(description="Joc de sah.")
+    parser.add_argument("--uci", action="store_true", help="ruleaza motorul UCI pe stdin/stdout, fara interfata")
+    parser.add_argument("--renderer", choices=["buttons", "canvas"], default="buttons", help="desenarea tablei in GUI")
+    args = parser.parse_args(argv)
+
+    if args.uci:
+        from uci import main as uci_main
+
+        return uci_main()
+
+    from gui import run_gui
+
+    run_gui(args.renderer)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+from evaluation import PIECE_VALUE
+from pieces import Color
+
+
+MAX_PLY = 128
+"""
+Numarul maxim de semi-mutari de la radacina pentru care se pastreaza killer moves.
+"""
+
+HASH_MOVE_SCORE = 10_000_000
+CAPTURE_SCORE = 1_000_000
+KILLER_SCORES = (900_000, 800_000)
+HISTORY_MAX = 500_000
+"""
+Scoruri de ordonare: mutarea din tabela de transpozitie, apoi capturile
+(MVV-LVA), apoi cele doua killer moves, apoi mutarile linistite dupa
+scorul din history (plafonat sub killer moves).
+"""
+
+
+def mvv_lva(board, move) -> int:
+    """
+    Scor MVV-LVA (Most Valuable Victim - Least Valuable Attacker):
+    intai capturile celor mai valoroase piese, iar la victima egala
+    capturile facute cu piesa cea mai ieftina. Promovarile adauga
+    valoarea piesei noi.
+
+    :return: scor (0 pentru mutari linistite)
+    """
+    (fr, fc), (tr, tc), promo = move
+    victim = board.get_piece(tr, tc)
+    score = 0
+    if victim is not None:
+        score = PIECE_VALUE[victim.piece_type] * 16 - PIECE_VALUE[board.get_piece(fr, fc).piece_type] // 100
+    if promo is not None:
+        score += PIECE_VALUE[promo] * 16
+    return score
+
+
+class MoveOrderer:
+    """
+    Ordonarea mutarilor pentru cautarea alpha-beta.
+
+    La fiecare nod mutarile sunt cautate in ordinea:
+    1. mutarea din tabela de transpozitie (hash/PV move)
+    2. capturi si promovari, dupa MVV-LVA
+    3. killer moves: mutari linistite care au produs cutoff la acelasi ply
+    4. restul mutarilor linistite, dupa scorul history
+
+    O ordonare buna produce cutoff-uri mai devreme si reduce
+    numarul de noduri cautate.
+    """
+
+    def __init__(self):
+        """
+        Creeaza tabele goale de killer moves si history.
+        """
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = ({}, {})
+
+    def new_search(self):
+        """
+        Pregateste tabelele pentru o cautare noua:
+        killer moves sunt sterse, iar scorurile history sunt injumatatite
+        (imbatranire), ca informatia veche sa conteze mai putin.
+        """
+        for slot in self.killers:
+            slot[0] = None
+            slot[1] = None
+        for table in self.history:
+            for move_key in list(table):
+                value = table[move_key] // 2
+                if value:
+                    table[move_key] = value
+                else:
+                    del table[move_key]
+
+    def order(self, game, moves, ply: int, hash_move=None):
+        """
+        Returneaza mutarile sortate pentru cautare.
+
+        :param game: instanta ChessGame (pozitia inainte de mutari)
+        :param moves: lista de mutari (from_pos, to_pos, promotion)
+        :param ply: distanta de la radacina
+        :param hash_move: mutarea din tabela de transpozitie (optional)
+        :return: lista noua, sortata descrescator dupa prioritate
+        """
+        board = game.board
+        history = self.history[0 if game.current_player == Color.WHITE else 1]
+        killer_1, killer_2 = self.killers[ply] if ply < MAX_PLY else (None, None)
+
+        scored = []
+        for move in moves:
+            if move == hash_move:
+                score = HASH_MOVE_SCORE
+            else:
+                score = mvv_lva(board, move)
+                if score:
+                    score += CAPTURE_SCORE
+                elif move == killer_1:
+                    score = KILLER_SCORES[0]
+                elif move == killer_2:
+                    score = KILLER_SCORES[1]
+                else:
+                    score = history.get((move[0], move[1]), 0)
+            scored.append((score, move))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [move for _, move in scored]
+
+    def record_cutoff(self, game, move, ply: int, depth: int):
+        """
+        Actualizeaza tabelele dupa ce o mutare a produs un cutoff beta.
+
+        Doar mutarile linistite sunt memorate (capturile sunt deja
+        ordonate prin MVV-LVA).
+
+        :param game: instanta ChessGame (pozitia inainte de mutare)
+        :param move: mutarea care a produs cutoff-ul
+        :param ply: distanta de la radacina
+        :param depth: adancimea ramasa (cutoff-urile adanci conteaza mai mult)
+        """
+        if mvv_lva(game.board, move):
+            return
+
+        if ply < MAX_PLY:
+            slot = self.killers[ply]
+            if slot[0] != move:
+                slot[1] = slot[0]
+                slot[0] = move
+
+        history = self.history[0 if game.current_player == Color.WHITE else 1]
+        move_key = (move[0], move[1])
+        history[move_key] = min(HISTORY_MAX, history.get(move_key, 0) + depth * depth)
@@ -0,0 +1,162 @@
+import argparse
+import sys
+import time
+
+from bitboard import BitboardBoard
+from board import Board
+from game import ChessGame
+
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+PERFT_POSITIONS = [
+    ("start", START_FEN, [20, 400, 8902, 197281, 4865609]),
+    (
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        [48, 2039, 97862, 4085603],
+    ),
+    ("endgame", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [14, 191, 2812, 43238, 674624]),
+    (
+        "promotions",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        [6, 264, 9467, 422333],
+    ),
+    ("middlegame", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", [44, 1486, 62379, 2103487]),
+    (
+        "symmetric",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        [46, 2079, 89890, 3894594],
+    ),
+]
+"""
+Pozitii de test cu numarul cunoscut de noduri frunza pe adancimi (1, 2, ...).
+
+Acopera rocada, en passant, promovari si sahuri descoperite.
+"""
+
+BOARDS = {"list": Board, "bitboard": BitboardBoard}
+"""
+Implementarile de tabla care pot fi testate. Jocul foloseste implicit
+BitboardBoard; Board ramane pentru verificare si comparatie.
+"""
+
+
+def perft(game: ChessGame, depth: int) -> int:
+    """
+    Numara nodurile frunza ale arborelui de mutari legale pana la adancimea data.
+
+    :param game: instanta ChessGame (este readusa la starea initiala la final)
+    :param depth: adancimea in semi-mutari
+    :return: numarul de noduri frunza
+    """
+    if depth <= 0:
+        return 1
+    moves = game.get_all_legal_moves(game.current_player)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = game.make_move(move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move(undo)
+    return nodes
+
+
+def divide(game: ChessGame, depth: int):
+    """
+    Ca perft, dar intoarce numarul de noduri separat pentru fiecare mutare de la radacina.
+
+    :return: dictionar {"e2e4": noduri, ...}
+    """
+    result = {}
+    for move in game.get_all_legal_moves(game.current_player):
+        from_alg, to_alg = game.move_to_algebraic(move)
+        undo = game.make_move(move)
+        result[from_alg + to_alg.lower()] = perft(game, depth - 1)
+        game.unmake_move(undo)
+    return result
+
+
+def timed_perft(game: ChessGame, depth: int):
+    """
+    Ruleaza perft si masoara timpul.
+
+    :return: tuplu (noduri, secunde, noduri pe secunda)
+    """
+    start = time.perf_counter()
+    nodes = perft(game, depth)
+    elapsed = time.perf_counter() - start
+    nps = nodes / elapsed if elapsed > 0 else 0.0
+    return nodes, elapsed, nps
+
+
+def run_suite(max_depth: int, board_cls=Board, out=sys.stdout) -> bool:
+    """
+    Ruleaza perft pe toate pozitiile din PERFT_POSITIONS, pana la max_depth,
+    si compara cu numarul cunoscut de noduri.
+
+    :return: True daca toate rezultatele sunt corecte
+    """
+    ok = True
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen, expected in PERFT_POSITIONS:
+        for depth in range(1, min(max_depth, len(expected)) + 1):
+            game = ChessGame.from_fen(fen, board_cls())
+            nodes, elapsed, nps = timed_perft(game, depth)
+            total_nodes += nodes
+            total_time += elapsed
+            passed = nodes == expected[depth - 1]
+            ok = ok and passed
+            out.write(
+                f"{name:<12} depth {depth}  nodes {nodes:>10}  expected {expected[depth - 1]:>10}  "
+                f"{elapsed:8.3f}s  {nps:10.0f} nps  {'OK' if passed else 'FAIL'}\n"
+            )
+    total_nps = total_nodes / total_time if total_time > 0 else 0.0
+    out.write(f"total        nodes {total_nodes}  {total_time:.3f}s  {total_nps:.0f} nps  {'OK' if ok else 'FAIL'}\n")
+    return ok
+
+
+def main(argv=None) -> int:
+    """
+    Punct de intrare pentru linia de comanda.
+
+    Exemple:
+        python perft.py --suite --depth 3
+        python perft.py --depth 4
+        python perft.py --fen "<fen>" --depth 3 --divide
+        python perft.py --suite --board bitboard
+    """
+    parser = argparse.ArgumentParser(description="Perft: verificare si benchmark pentru generarea mutarilor.")
+    parser.add_argument("--fen", default=START_FEN, help="pozitia de pornire (implicit pozitia initiala)")
+    parser.add_argument("--depth", type=int, default=3, help="adancimea in semi-mutari")
+    parser.add_argument("--divide", action="store_true", help="afiseaza numarul de noduri pe fiecare mutare")
+    parser.add_argument("--suite", action="store_true", help="ruleaza toate pozitiile de test")
+    parser.add_argument("--board", choices=sorted(BOARDS), default="list", help="implementarea tablei")
+    args = parser.parse_args(argv)
+
+    board_cls = BOARDS[args.board]
+
+    if args.suite:
+        return 0 if run_suite(args.depth, board_cls) else 1
+
+    game = ChessGame.from_fen(args.fen, board_cls())
+    if args.divide:
+        start = time.perf_counter()
+        counts = divide(game, args.depth)
+        elapsed = time.perf_counter() - start
+        for move in sorted(counts):
+            print(f"{move}: {counts[move]}")
+        nodes = sum(counts.values())
+        print(f"\nmoves {len(counts)}  nodes {nodes}  {elapsed:.3f}s")
+        return 0
+
+    nodes, elapsed, nps = timed_perft(game, args.depth)
+    print(f"depth {args.depth}  nodes {nodes}  {elapsed:.3f}s  {nps:.0f} nps")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import threading
+
+
+class BackgroundSearch:
+    """
+    O cautare ChessAI.find_best_move care ruleaza intr-un fir de executie
+    separat, pe o copie a jocului, ca firul principal (de exemplu bucla
+    Tkinter) sa ramana liber.
+
+    Rezultatul se verifica cu done() / result sau se asteapta cu wait().
+    Cat timp cautarea ruleaza, AI-ul nu trebuie folosit din alt fir de executie.
+    """
+
+    def __init__(self, ai, game, time_ms=None):
+        """
+        Porneste cautarea.
+
+        :param ai: instanta ChessAI
+        :param game: instanta ChessGame (nu este modificata; se cauta pe o copie)
+        :param time_ms: timpul maxim de cautare in milisecunde (optional)
+        """
+        self.ai = ai
+        self.key = game.zobrist_key
+        self.cancel_token = threading.Event()
+        self.result = None
+        self._thread = threading.Thread(target=self._run, args=(game.copy(), time_ms), daemon=True)
+        self._thread.start()
+
+    def _run(self, game, time_ms):
+        """
+        Corpul firului de executie.
+        """
+        self.result = self.ai.find_best_move(game, time_ms, cancel_token=self.cancel_token)
+
+    def done(self) -> bool:
+        """
+        True daca cautarea s-a terminat (rezultatul este in self.result).
+        """
+        return not self._thread.is_alive()
+
+    def wait(self):
+        """
+        Asteapta terminarea cautarii.
+
+        :return: mutarea gasita (sau None daca nu exista mutari)
+        """
+        self._thread.join()
+        return self.result
+
+    def cancel(self):
+        """
+        Anuleaza cautarea si asteapta oprirea ei.
+        """
+        self.cancel_token.set()
+        self._thread.join()
+
+
+class Ponderer:
+    """
+    Cautare in fundal (pondering) in timp ce adversarul uman se gandeste.
+
+    Dupa ce AI-ul muta, se presupune raspunsul asteptat al adversarului
+    (urmatoarea mutare din varianta principala) si se cauta deja pozitia
+    rezultata, intr-un fir de executie separat, pe o copie a jocului.
+    Tabela de transpozitie a AI-ului ramane astfel "calda".
+
+    Cand adversarul muta:
+    - ponder hit (a jucat mutarea asteptata): cautarea continua si
+      rezultatul ei este folosit direct
+    - ponder miss: cautarea este anulata, iar AI-ul cauta normal
+
+    AI-ul nu trebuie folosit din alt fir de executie cat timp ponderer-ul
+    este activ: take(), resolve() sau stop() trebuie apelate inainte.
+    """
+
+    def __init__(self, ai):
+        """
+        :param ai: instanta ChessAI folosita atat pentru pondering, cat si pentru cautarea normala
+        """
+        self.ai = ai
+        self._search = None
+        self._depth = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """
+        True daca exista o cautare de pondering (in curs sau terminata) nefolosita.
+        """
+        return self._search is not None
+
+    def start(self, game, predicted_move):
+        """
+        Porneste pondering-ul pe pozitia de dupa mutarea asteptata a adversarului.
+
+        :param game: instanta ChessGame, cu adversarul la mutare (nu este modificata)
+        :param predicted_move: mutarea asteptata, in formatul lui get_all_legal_moves
+        :return: True daca pondering-ul a pornit
+        """
+        self.stop()
+        if predicted_move is None or predicted_move not in game.get_all_legal_moves(game.current_player):
+            return False
+
+        position = game.copy()
+        position.make_move(predicted_move)
+        if not position.get_all_legal_moves(position.current_player):
+            return False
+
+        self._depth = self.ai.depth
+        self._search = BackgroundSearch(self.ai, position)
+        return True
+
+    def take(self, game, depth: int):
+        """
+        Este apelata cand AI-ul trebuie sa mute, fara a astepta.
+
+        Daca pozitia curenta este cea pentru care s-a facut pondering (si la
+        aceeasi adancime), cautarea din fundal devine cautarea pentru mutarea
+        AI-ului si este intoarsa (poate fi inca in curs). Altfel este anulata.
+
+        :param game: instanta ChessGame, cu AI-ul la mutare
+        :param depth: adancimea ceruta pentru mutarea AI-ului
+        :return: BackgroundSearch (ponder hit) sau None (ponder miss)
+        """
+        search = self._search
+        if search is None:
+            return None
+        if game.zobrist_key != search.key or depth != self._depth:
+            self.misses += 1
+            self.stop()
+            return None
+
+        self._search = None
+        self.hits += 1
+        return search
+
+    def resolve(self, game, depth: int):
+        """
+        Ca take(), dar asteapta terminarea cautarii.
+
+        :return: mutarea gasita prin pondering sau None (ponder miss)
+        """
+        search = self.take(game, depth)
+        return search.wait() if search is not None else None
+
+    def stop(self):
+        """
+        Anuleaza pondering-ul in curs (daca exista) si asteapta oprirea lui.
+        """
+        if self._search is None:
+            return
+        self._search.cancel()
+        self._search = None
@@ -0,0 +1,146 @@
+import time
+
+
+class SearchStats:
+    """
+    Statistici pentru o cautare a lui ChessAI, pentru reglaj si afisare.
+
+    - nodes: toate nodurile cautate (inclusiv cele de quiescence)
+    - qnodes: nodurile cautate in quiescence
+    - cutoffs: cutoffs[i] = de cate ori mutarea cu indexul i a produs
+      un cutoff beta (o ordonare buna pune majoritatea pe indexul 0)
+    - tt_hits / tt_misses: probele tabelei de transpozitie in aceasta cautare
+    - iterations: lista (depth, secunde, noduri) pentru fiecare adancime terminata
+    - elapsed: secundele pana la ultima adancime terminata, sau pana la
+      sfarsitul cautarii dupa finish()
+    """
+
+    def __init__(self):
+        """
+        Creeaza statistici goale si porneste cronometrul.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Sterge toate contoarele si reporneste cronometrul.
+        """
+        self.nodes = 0
+        self.qnodes = 0
+        self.cutoffs = []
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.iterations = []
+        self.start_time = time.perf_counter()
+        self.elapsed = 0.0
+
+    def record_cutoff(self, index: int):
+        """
+        Numara un cutoff beta produs de mutarea cu indexul dat.
+        """
+        cutoffs = self.cutoffs
+        while len(cutoffs) <= index:
+            cutoffs.append(0)
+        cutoffs[index] += 1
+
+    def record_iteration(self, depth: int):
+        """
+        Marcheaza terminarea unei adancimi de cautare.
+        """
+        now = time.perf_counter()
+        previous = self.start_time + self.elapsed
+        self.elapsed = now - self.start_time
+        nodes_before = sum(nodes for _, _, nodes in self.iterations)
+        self.iterations.append((depth, now - previous, self.nodes - nodes_before))
+
+    def finish(self):
+        """
+        Marcheaza sfarsitul cautarii: elapsed include si timpul petrecut in
+        adancimea neterminata (oprita de timp sau anulata), ca nps sa fie corect.
+        """
+        self.elapsed = time.perf_counter() - self.start_time
+
+    def at_depth(self, depth: int):
+        """
+        Returneaza statisticile cumulate pana la sfarsitul adancimii date,
+        construite din self.iterations (de exemplu pentru raportarea pe
+        adancimi dupa cautarea paralela, cand progress este apelata la final).
+
+        Doar nodes, elapsed si iterations sunt pastrate pe adancimi; celelalte
+        contoare raman la zero.
+        """
+        done = self.iterations[:depth]
+        stats = SearchStats()
+        stats.start_time = self.start_time
+        stats.iterations = list(done)
+        stats.nodes = sum(nodes for _, _, nodes in done)
+        stats.elapsed = sum(seconds for _, seconds, _ in done)
+        return stats
+
+    def merge(self, other):
+        """
+        Adauga contoarele altei cautari (de exemplu ale unui proces din
+        cautarea paralela). Timpii nu se aduna, pentru ca cautarile ruleaza
+        simultan: se pastreaza cel mai lung.
+        """
+        self.nodes += other.nodes
+        self.qnodes += other.qnodes
+        for index, count in enumerate(other.cutoffs):
+            if index < len(self.cutoffs):
+                self.cutoffs[index] += count
+            else:
+                self.cutoffs.append(count)
+        self.tt_hits += other.tt_hits
+        self.tt_misses += other.tt_misses
+        for index, (depth, seconds, nodes) in enumerate(other.iterations):
+            if index < len(self.iterations):
+                _, own_seconds, own_nodes = self.iterations[index]
+                self.iterations[index] = (depth, max(seconds, own_seconds), nodes + own_nodes)
+            else:
+                self.iterations.append((depth, seconds, nodes))
+        self.elapsed = max(self.elapsed, other.elapsed)
+
+    def nps(self) -> float:
+        """
+        Returneaza numarul de noduri pe secunda.
+        """
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def tt_hit_rate(self) -> float:
+        """
+        Returneaza procentul de probe reusite ale tabelei de transpozitie (0.0 - 1.0).
+        """
+        probes = self.tt_hits + self.tt_misses
+        return self.tt_hits / probes if probes else 0.0
+
+    def first_move_cutoff_rate(self) -> float:
+        """
+        Returneaza procentul de cutoff-uri produse de prima mutare cautata (0.0 - 1.0).
+        """
+        total = sum(self.cutoffs)
+        return self.cutoffs[0] / total if total else 0.0
+
+    def as_dict(self):
+        """
+        Returneaza statisticile ca dictionar, pentru jurnale.
+        """
+        return {
+            "nodes": self.nodes,
+            "qnodes": self.qnodes,
+            "nps": self.nps(),
+            "elapsed": self.elapsed,
+            "cutoffs": list(self.cutoffs),
+            "first_move_cutoff_rate": self.first_move_cutoff_rate(),
+            "tt_hit_rate": self.tt_hit_rate(),
+            "iterations": list(self.iterations),
+        }
+
+    def __str__(self):
+        """
+        Rezumat pe o linie, pentru jurnale.
+        """
+        depth = self.iterations[-1][0] if self.iterations else 0
+        return (
+            f"depth {depth}  nodes {self.nodes}  qnodes {self.qnodes}  {self.elapsed:.3f}s  "
+            f"{self.nps():.0f} nps  tt {self.tt_hit_rate():.1%}  first-move cutoffs {self.first_move_cutoff_rate():.1%}"
+        )
@@ -0,0 +1,363 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from ai import ChessAI
+from game import ChessGame
+from uci import move_to_uci
+
+
+DEFAULT_TIME_MS = 1000
+MAX_TIME_MS = 10000
+"""
+Bugetul de timp implicit si maxim pentru o cautare, in milisecunde.
+Bugetul include si timpul petrecut in coada.
+"""
+
+WORKER_TT_MB = 16
+"""
+Memoria tabelei de transpozitie a fiecarui proces de cautare, in MB.
+"""
+
+LATENCY_SAMPLES = 1000
+"""
+Cate latente recente sunt pastrate pentru calculul percentilelor.
+"""
+
+
+def _percentile(sorted_values, fraction: float):
+    """
+    Returneaza percentila data (0.0 - 1.0) dintr-o lista sortata, sau None daca este goala.
+    """
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class GameServer:
+    """
+    Server asyncio care tine in memorie mai multe partide (ChessGame)
+    si trimite cautarile AI-ului catre un pool limitat de procese.
+
+    Protocolul este JSON pe linii (o cerere pe linie, un raspuns pe linie),
+    peste TCP sau un socket Unix. Cereri (campul "op"):
+    - {"op": "new", "fen": optional} -> {"ok": true, "game": id, "fen": ...}
+    - {"op": "move", "game": id, "move": "e2e4"} -> starea partidei
+    - {"op": "go", "game": id, "time_ms": optional, "play": optional}
+      -> {"ok": true, "move": "e7e5", "score": ..., "nodes": ...}
+    - {"op": "state", "game": id} -> fen, jucatorul la mutare, status, mutari (UCI)
+    - {"op": "close", "game": id}
+    - {"op": "stats"} -> partide, coada, cautari in curs, percentile de latenta
+
+    Backpressure: cel mult max_queue cautari pot astepta sau rula simultan;
+    peste aceasta limita cererile "go" sunt respinse imediat cu "Server busy",
+    iar clientul poate reincerca. O partida poate avea o singura cautare in curs.
+    Erorile sunt raspunsuri {"ok": false, "error": mesaj}.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64, max_games: int = 1000):
+        """
+        :param workers: numarul de procese pentru cautari
+        :param max_queue: numarul maxim de cautari in asteptare sau in curs
+        :param max_games: numarul maxim de partide tinute in memorie
+        """
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.max_games = max(1, int(max_games))
+        self.games = {}
+        self._busy_games = set()
+        self._ids = itertools.count(1)
+        self._pool = None
+        self._slots = None
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    async def start(self, host="127.0.0.1", port=0, unix_path=None):
+        """
+        Porneste pool-ul de procese si serverul.
+
+        :param host: adresa TCP (ignorata daca unix_path este dat)
+        :param port: portul TCP (0 = ales de sistem)
+        :param unix_path: calea unui socket Unix (optional)
+        :return: serverul asyncio
+        """
+        self._pool = self._new_pool()
+        self._slots = asyncio.Semaphore(self.workers)
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self._handle_client, path=unix_path)
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    def _new_pool(self):
+        """
+        Creeaza pool-ul de procese pentru cautari. Procesele sunt pornite cu
+        "spawn": un fork dintr-un proces cu mai multe fire de executie poate
+        copia un lock ocupat si bloca procesul copil.
+        """
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _replace_pool(self, broken):
+        """
+        Inlocuieste un pool in care un proces a murit (BrokenProcessPool),
+        altfel toate cautarile urmatoare ar esua. Daca mai multe cautari
+        observa acelasi pool stricat, doar prima il inlocuieste.
+        """
+        if self._pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+
+    def close(self):
+        """
+        Opreste pool-ul de procese.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def _handle_client(self, reader, writer):
+        """
+        Trateaza o conexiune: citeste cereri pe linii si raspunde in ordine.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be a JSON object")
+                    response = await self.handle(request)
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"ok": False, "error": str(e)}
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle(self, request):
+        """
+        Executa o cerere.
+
+        :param request: dictionarul cererii
+        :return: dictionarul raspunsului
+        :raises ValueError: daca cererea nu este valida
+        """
+        op = request.get("op")
+        if op == "new":
+            return self._new_game(request.get("fen"))
+        if op == "move":
+            return self._move(self._game_id(request), str(request["move"]))
+        if op == "go":
+            time_ms = int(request.get("time_ms", DEFAULT_TIME_MS))
+            return await self._go(self._game_id(request), time_ms, bool(request.get("play", False)))
+        if op == "state":
+            return self._state(self._game_id(request))
+        if op == "close":
+            game_id = self._game_id(request)
+            if game_id in self._busy_games:
+                raise ValueError("Game is busy")
+            del self.games[game_id]
+            return {"ok": True}
+        if op == "stats":
+            return self.stats()
+        raise ValueError("Unknown op")
+
+    def _game_id(self, request) -> str:
+        """
+        Returneaza id-ul partidei din cerere.
+
+        :raises ValueError: daca partida nu exista
+        """
+        game_id = str(request.get("game"))
+        if game_id not in self.games:
+            raise ValueError("Unknown game")
+        return game_id
+
+    def _new_game(self, fen=None):
+        """
+        Creeaza o partida noua (din pozitia initiala sau dintr-un FEN).
+        """
+        if len(self.games) >= self.max_games:
+            raise ValueError("Too many games")
+        game = ChessGame.from_fen(fen) if fen else ChessGame()
+        game_id = str(next(self._ids))
+        self.games[game_id] = game
+        return {"ok": True, "game": game_id, "fen": game.to_fen()}
+
+    def _state(self, game_id):
+        """
+        Returneaza starea unei partide.
+        """
+        game = self.games[game_id]
+        return {
+            "ok": True,
+            "game": game_id,
+            "fen": game.to_fen(),
+            "turn": game.current_player.name,
+            "status": game.get_status_for(game.current_player),
+            "moves": [mv.from_pos + mv.to_pos + (mv.promotion or "").lower() for mv in game.history],
+        }
+
+    def _move(self, game_id, move: str):
+        """
+        Aplica o mutare in notatie UCI (ex: e2e4, e7e8q).
+        """
+        if game_id in self._busy_games:
+            raise ValueError("Game is busy")
+        game = self.games[game_id]
+        if len(move) < 4:
+            raise ValueError("Invalid move")
+        game.move(move[:2], move[2:])
+        return self._state(game_id)
+
+    async def _go(self, game_id, time_ms: int, play: bool):
+        """
+        Cauta cea mai buna mutare intr-un proces din pool.
+
+        Bugetul de timp (plafonat la MAX_TIME_MS) include asteptarea in coada:
+        procesul primeste doar timpul ramas (cel putin o iteratie completa
+        este cautata oricum).
+
+        :raises ValueError: daca serverul sau partida sunt ocupate, sau daca
+                            procesul de cautare a murit (pool-ul este recreat)
+        """
+        if game_id in self._busy_games:
+            raise ValueError("Game is busy")
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise ValueError("Server busy")
+
+        budget = max(1, min(time_ms, MAX_TIME_MS))
+        start = time.perf_counter()
+        game = self.games[game_id]
+        fen = game.to_fen()
+        self._busy_games.add(game_id)
+        self.pending += 1
+        try:
+            async with self._slots:
+                self.running += 1
+                try:
+                    waited_ms = (time.perf_counter() - start) * 1000
+                    remaining = max(1, int(budget - waited_ms))
+                    loop = asyncio.get_running_loop()
+                    pool = self._pool
+                    try:
+                        move, score, nodes = await loop.run_in_executor(pool, _search_fen, fen, remaining)
+                    except BrokenProcessPool:
+                        self._replace_pool(pool)
+                        raise ValueError("Search worker crashed, retry the request")
+                finally:
+                    self.running -= 1
+        finally:
+            self.pending -= 1
+            self._busy_games.discard(game_id)
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.latencies.append(latency_ms)
+        self.completed += 1
+
+        response = {"ok": True, "game": game_id, "move": move, "score": score, "nodes": nodes, "ms": latency_ms}
+        if play and move is not None and game_id in self.games:
+            response["state"] = self._move(game_id, move)
+        return response
+
+    def stats(self):
+        """
+        Returneaza starea serverului: partide, coada, cautari si latente (ms).
+        """
+        latencies = sorted(self.latencies)
+        return {
+            "ok": True,
+            "games": len(self.games),
+            "queue_depth": self.pending - self.running,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_ms": {
+                "p50": _percentile(latencies, 0.50),
+                "p90": _percentile(latencies, 0.90),
+                "p99": _percentile(latencies, 0.99),
+                "max": latencies[-1] if latencies else None,
+            },
+        }
+
+
+_worker_ai = None
+"""
+AI-ul unui proces de cautare, pastrat intre cereri (pentru tabela de transpozitie).
+"""
+
+
+def _search_fen(fen: str, time_ms: int):
+    """
+    Functia rulata intr-un proces din pool: cauta pozitia data.
+
+    :return: tuplu (mutare UCI sau None, scor, noduri)
+    """
+    global _worker_ai
+    if _worker_ai is None:
+        _worker_ai = ChessAI(tt_size_mb=WORKER_TT_MB)
+    game = ChessGame.from_fen(fen)
+    best = _worker_ai.find_best_move(game, time_ms)
+    if best is None:
+        return None, None, _worker_ai.stats.nodes
+    return move_to_uci(best), _worker_ai.last_score, _worker_ai.stats.nodes
+
+
+async def _serve(args):
+    """
+    Porneste serverul si ruleaza pana la intrerupere.
+    """
+    server = GameServer(args.workers, args.max_queue, args.max_games)
+    listener = await server.start(args.host, args.port, args.unix)
+    try:
+        addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+        print(f"listening on {addresses}", flush=True)
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main(argv=None) -> int:
+    """
+    Punct de intrare pentru linia de comanda.
+
+    Exemple:
+        python server.py --port 8765 --workers 4
+        python server.py --unix /tmp/chess.sock
+    """
+    parser = argparse.ArgumentParser(description="Server asyncio pentru mai multe partide de sah.")
+    parser.add_argument("--host", default="127.0.0.1", help="adresa TCP")
+    parser.add_argument("--port", type=int, default=8765, help="portul TCP")
+    parser.add_argument("--unix", default=None, help="calea unui socket Unix (in loc de TCP)")
+    parser.add_argument("--workers", type=int, default=2, help="numarul de procese pentru cautari")
+    parser.add_argument("--max-queue", type=int, default=64, help="cautari maxime in asteptare sau in curs")
+    parser.add_argument("--max-games", type=int, default=1000, help="partide maxime in memorie")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
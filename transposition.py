@@ -0,0 +1,152 @@
+EXACT = 0
+LOWER = 1
+UPPER = 2
+"""
+Tipul scorului memorat:
+
+EXACT - scorul exact al pozitiei
+LOWER - limita inferioara (cautarea s-a oprit la un cutoff beta)
+UPPER - limita superioara (nicio mutare nu a depasit alpha)
+"""
+
+
+class TranspositionTable:
+    """
+    Tabela de transpozitie pentru cautarea AI-ului.
+
+    Memoreaza, pentru fiecare pozitie (cheie Zobrist), adancimea cautata,
+    scorul, tipul scorului (EXACT/LOWER/UPPER) si cea mai buna mutare.
+
+    Memoria este limitata: tabela are un numar fix de bucket-uri,
+    calculat din dimensiunea in MB. Fiecare bucket are doua locuri:
+    - unul "depth-preferred", inlocuit doar de o cautare cel putin la fel de
+      adanca sau de o intrare dintr-o cautare mai veche
+    - unul "always-replace", in care ajung celelalte intrari
+    """
+
+    ENTRY_BYTES = 256
+    """
+    Estimare aproximativa a memoriei ocupate de o intrare
+    (tuplul, intregii si mutarea), folosita pentru a dimensiona tabela.
+    """
+
+    def __init__(self, size_mb: float = 16):
+        """
+        Creeaza o tabela goala.
+
+        :param size_mb: memoria maxima aproximativa, in MB
+        """
+        entries = max(2, int(size_mb * 1024 * 1024) // self.ENTRY_BYTES)
+        buckets = 1
+        while buckets * 2 <= entries // 2:
+            buckets *= 2
+        self.size_mb = size_mb
+        self.mask = buckets - 1
+        self.generation = 0
+        self.deep = [None] * buckets
+        self.recent = [None] * buckets
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Reseteaza contoarele de hit/miss/store/overwrite.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def clear(self):
+        """
+        Sterge toate intrarile si contoarele.
+        """
+        self.deep = [None] * len(self.deep)
+        self.recent = [None] * len(self.recent)
+        self.generation = 0
+        self.reset_stats()
+
+    def new_search(self):
+        """
+        Marcheaza inceputul unei cautari noi.
+
+        Intrarile din cautarile anterioare raman utilizabile, dar
+        locul depth-preferred poate fi suprascris de intrari noi.
+        """
+        self.generation += 1
+
+    def probe(self, key: int):
+        """
+        Cauta pozitia in tabela.
+
+        :return: tuplu (depth, score, flag, move) sau None daca nu exista
+        """
+        index = key & self.mask
+        entry = self.deep[index]
+        if entry is None or entry[0] != key:
+            entry = self.recent[index]
+            if entry is None or entry[0] != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return entry[1], entry[2], entry[3], entry[4]
+
+    def best_move(self, key: int):
+        """
+        Returneaza mutarea memorata pentru pozitie, fara a modifica contoarele
+        (folosita pentru extragerea variantei principale).
+
+        :return: mutarea sau None
+        """
+        index = key & self.mask
+        for entry in (self.deep[index], self.recent[index]):
+            if entry is not None and entry[0] == key:
+                return entry[4]
+        return None
+
+    def store(self, key: int, depth: int, score: int, flag: int, move):
+        """
+        Memoreaza rezultatul cautarii unei pozitii.
+
+        :param key: cheia Zobrist a pozitiei
+        :param depth: adancimea ramasa la care a fost cautata pozitia
+        :param score: scorul gasit
+        :param flag: EXACT, LOWER sau UPPER
+        :param move: cea mai buna mutare gasita (sau None)
+        """
+        index = key & self.mask
+        entry = (key, depth, score, flag, move, self.generation)
+        self.stores += 1
+
+        deep = self.deep[index]
+        if deep is None or deep[0] == key or depth >= deep[1] or deep[5] != self.generation:
+            if deep is not None and deep[0] != key:
+                self.overwrites += 1
+            self.deep[index] = entry
+            return
+
+        recent = self.recent[index]
+        if recent is not None and recent[0] != key:
+            self.overwrites += 1
+        self.recent[index] = entry
+
+    def hit_rate(self) -> float:
+        """
+        Returneaza procentul de probe reusite (0.0 - 1.0).
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats(self):
+        """
+        Returneaza contoarele tabelei, pentru reglaj.
+
+        :return: dictionar cu hits, misses, stores, overwrites, hit_rate, buckets
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hit_rate": self.hit_rate(),
+            "buckets": self.mask + 1,
+        }
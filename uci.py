@@ -0,0 +1,291 @@
+import sys
+import threading
+
+from ai import ChessAI, MATE_SCORE, MATE_THRESHOLD, MAX_SEARCH_DEPTH
+from game import ChessGame
+from pieces import Color
+
+
+ENGINE_NAME = "ProiectPythonNituEmma"
+ENGINE_AUTHOR = "Nitu Emma"
+"""
+Numele si autorul raportate la comanda "uci".
+"""
+
+DEFAULT_DEPTH = 3
+"""
+Adancimea folosita pentru "go" fara limita de adancime sau de timp.
+"""
+
+MOVE_OVERHEAD_MS = 50
+"""
+Timp rezervat pentru comunicare la fiecare mutare, cand se joaca pe ceas.
+"""
+
+DEFAULT_MOVES_TO_GO = 30
+"""
+Numarul estimat de mutari ramase pana la control, cand GUI-ul nu trimite movestogo.
+"""
+
+GO_NUMERIC_PARAMS = ("wtime", "btime", "winc", "binc", "movestogo", "depth", "nodes", "mate", "movetime")
+GO_FLAGS = ("ponder", "infinite")
+"""
+Parametrii comenzii go urmati de o valoare intreaga, respectiv parametrii fara valoare.
+"""
+
+
+def move_to_uci(move) -> str:
+    """
+    Converteste o mutare (from_pos, to_pos, promotion) in notatia UCI (ex: e2e4, e7e8q).
+    """
+    from_alg, to_alg = ChessGame.move_to_algebraic(move)
+    return from_alg + to_alg.lower()
+
+
+def score_to_uci(score: int) -> str:
+    """
+    Converteste un scor al cautarii in formatul UCI: "cp <centipioni>"
+    sau "mate <mutari>" (negativ daca jucatorul la mutare primeste mat).
+    """
+    if score >= MATE_THRESHOLD:
+        return f"mate {(MATE_SCORE - score + 1) // 2}"
+    if score <= -MATE_THRESHOLD:
+        return f"mate -{(MATE_SCORE + score + 1) // 2}"
+    return f"cp {score}"
+
+
+class UCIEngine:
+    """
+    Motor de sah care vorbeste protocolul UCI (Universal Chess Interface)
+    pe stdin/stdout, pentru GUI-uri de sah, manageri de turnee si analiza
+    in lot. Nu importa tkinter.
+
+    Comenzi suportate: uci, isready, setoption (Hash, Threads), ucinewgame,
+    position [startpos | fen <fen>] [moves ...], go [depth | movetime |
+    wtime/btime/winc/binc/movestogo | infinite], stop, quit. La go, ponder si
+    searchmoves sunt acceptate, dar ignorate.
+
+    Cautarea ruleaza intr-un fir de executie separat, ca "stop" si
+    "isready" sa primeasca raspuns imediat.
+    """
+
+    def __init__(self, out=sys.stdout):
+        """
+        :param out: fluxul in care sunt scrise raspunsurile
+        """
+        self.out = out
+        self.hash_mb = 16
+        self.threads = 1
+        self.ai = ChessAI(DEFAULT_DEPTH, self.hash_mb)
+        self.game = ChessGame()
+        self._lock = threading.Lock()
+        self._search = None
+        self._cancel = None
+
+    def send(self, line: str):
+        """
+        Scrie o linie de raspuns (sigur din mai multe fire de executie).
+        """
+        with self._lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    def handle(self, line: str) -> bool:
+        """
+        Executa o comanda UCI.
+
+        :param line: linia primita
+        :return: False daca motorul trebuie oprit (comanda quit), altfel True
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(f"option name Hash type spin default {self.hash_mb} min 1 max 1024")
+            self.send(f"option name Threads type spin default {self.threads} min 1 max 64")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self.stop()
+            self._set_option(args)
+        elif command == "ucinewgame":
+            self.stop()
+            self.ai.tt.clear()
+            self.game = ChessGame()
+        elif command == "position":
+            self.stop()
+            self._set_position(args)
+        elif command == "go":
+            self.stop()
+            self._go(args)
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            self.ai.close()
+            return False
+        else:
+            self.send(f"info string unknown command {command}")
+        return True
+
+    def _set_option(self, args):
+        """
+        setoption name <nume> value <valoare>
+        """
+        if "name" not in args or "value" not in args:
+            return
+        name = " ".join(args[args.index("name") + 1:args.index("value")]).lower()
+        value = " ".join(args[args.index("value") + 1:])
+        try:
+            number = int(value)
+        except ValueError:
+            self.send(f"info string invalid value {value}")
+            return
+
+        if name == "hash":
+            self.hash_mb = max(1, number)
+        elif name == "threads":
+            self.threads = max(1, number)
+        else:
+            self.send(f"info string unknown option {name}")
+            return
+        self.ai.close()
+        self.ai = ChessAI(DEFAULT_DEPTH, self.hash_mb, workers=self.threads)
+
+    def _set_position(self, args):
+        """
+        position startpos [moves ...] / position fen <fen> [moves ...]
+        """
+        moves = []
+        if "moves" in args:
+            index = args.index("moves")
+            moves = args[index + 1:]
+            args = args[:index]
+
+        try:
+            if args and args[0] == "fen":
+                game = ChessGame.from_fen(" ".join(args[1:]))
+            else:
+                game = ChessGame()
+            for move in moves:
+                game.move(move[:2], move[2:])
+        except (ValueError, IndexError) as e:
+            self.send(f"info string invalid position: {e}")
+            return
+        self.game = game
+
+    def _go(self, args):
+        """
+        Porneste cautarea in fundal, dupa parametrii comenzii go.
+
+        Doar parametrii din GO_NUMERIC_PARAMS citesc o valoare; ponder si
+        infinite sunt indicatori, iar lista de dupa searchmoves este consumata
+        (si ignorata) pana la urmatorul parametru cunoscut. Parametrii
+        necunoscuti sunt sariti.
+        """
+        params = {}
+        flags = set()
+        i = 0
+        while i < len(args):
+            token = args[i]
+            i += 1
+            if token in GO_FLAGS:
+                flags.add(token)
+            elif token == "searchmoves":
+                while i < len(args) and args[i] not in GO_NUMERIC_PARAMS and args[i] not in GO_FLAGS:
+                    i += 1
+            elif token in GO_NUMERIC_PARAMS and i < len(args):
+                try:
+                    params[token] = int(args[i])
+                    i += 1
+                except ValueError:
+                    self.send(f"info string invalid value for {token}: {args[i]}")
+        infinite = "infinite" in flags
+
+        time_ms = None
+        depth = params.get("depth")
+        if infinite:
+            depth = MAX_SEARCH_DEPTH
+        elif "movetime" in params:
+            time_ms = params["movetime"]
+        else:
+            white = self.game.current_player == Color.WHITE
+            left = params.get("wtime" if white else "btime")
+            if left is not None:
+                inc = params.get("winc" if white else "binc", 0)
+                moves_to_go = params.get("movestogo", DEFAULT_MOVES_TO_GO)
+                budget = left // max(1, moves_to_go) + inc // 2
+                time_ms = max(1, min(budget, left - MOVE_OVERHEAD_MS))
+        if depth is None and time_ms is None:
+            depth = DEFAULT_DEPTH
+
+        self._cancel = threading.Event()
+        self._search = threading.Thread(
+            target=self._run_search, args=(self.game.copy(), time_ms, depth, self._cancel), daemon=True
+        )
+        self._search.start()
+
+    def _run_search(self, game, time_ms, depth, cancel):
+        """
+        Corpul firului de cautare: trimite linii info dupa fiecare adancime
+        si bestmove la final. Limitele de timp si de adancime (oricare poate
+        lipsi) se aplica impreuna: cautarea se opreste la prima atinsa.
+
+        Daca cautarea esueaza, eroarea este raportata ca "info string" si se
+        trimite totusi "bestmove 0000", ca GUI-ul sa nu astepte la nesfarsit.
+        """
+        try:
+            best = self.ai.find_best_move(game, time_ms, self._report, cancel, depth)
+            pv = self.ai.principal_variation(game, best, 2) if best is not None else []
+        except Exception as e:
+            self.send(f"info string search failed: {type(e).__name__}: {e}")
+            self.send("bestmove 0000")
+            return
+        if best is None:
+            self.send("bestmove 0000")
+            return
+
+        ponder = f" ponder {move_to_uci(pv[1])}" if len(pv) > 1 else ""
+        self.send(f"bestmove {move_to_uci(best)}{ponder}")
+
+    def _report(self, depth, move, score, pv, stats):
+        """
+        Callback de progres pentru ChessAI: o linie info pentru fiecare adancime terminata.
+        """
+        self.send(
+            f"info depth {depth} score {score_to_uci(score)} nodes {stats.nodes} "
+            f"nps {int(stats.nps())} time {int(stats.elapsed * 1000)} "
+            f"pv {' '.join(move_to_uci(m) for m in pv)}"
+        )
+
+    def stop(self):
+        """
+        Opreste cautarea in curs (daca exista); bestmove este trimis de firul de cautare.
+        """
+        if self._search is None:
+            return
+        self._cancel.set()
+        self._search.join()
+        self._search = None
+
+
+def main(stdin=sys.stdin, stdout=sys.stdout) -> int:
+    """
+    Punct de intrare: citeste comenzi UCI de pe stdin pana la quit sau EOF.
+    """
+    engine = UCIEngine(stdout)
+    for line in stdin:
+        if not engine.handle(line):
+            break
+    else:
+        engine.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
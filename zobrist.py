@@ -0,0 +1,71 @@
+import random
+
+from pieces import Color, PieceType
+
+
+_rng = random.Random(0x5A0B15)
+
+PIECE_KEYS = {
+    color: {ptype: [_rng.getrandbits(64) for _ in range(64)] for ptype in PieceType}
+    for color in Color
+}
+"""
+Chei aleatoare pe 64 de biti pentru fiecare (culoare, tip piesa, patrat).
+Patratul este indexat ca row * 8 + col.
+"""
+
+SIDE_KEY = _rng.getrandbits(64)
+"""
+Cheie aplicata cand negrul este la mutare.
+"""
+
+CASTLE_KEYS = tuple(_rng.getrandbits(64) for _ in range(4))
+"""
+Chei pentru drepturile de rocada, in ordinea: alb K, alb Q, negru K, negru Q.
+"""
+
+EP_FILE_KEYS = tuple(_rng.getrandbits(64) for _ in range(8))
+"""
+Chei pentru coloana tintei en passant (daca exista).
+"""
+
+
+def castle_rights_tuple(castle_rights):
+    """
+    Converteste dictionarul de drepturi de rocada intr-un tuplu
+    (alb K, alb Q, negru K, negru Q), aliniat cu CASTLE_KEYS.
+    """
+    white = castle_rights[Color.WHITE]
+    black = castle_rights[Color.BLACK]
+    return white["K"], white["Q"], black["K"], black["Q"]
+
+
+def compute_hash(game) -> int:
+    """
+    Calculeaza de la zero cheia Zobrist a pozitiei curente.
+
+    Cheia acopera piesele, jucatorul la mutare, drepturile de rocada
+    si tinta en passant. In timpul jocului cheia este actualizata
+    incremental de ChessGame; functia este folosita la initializare
+    si pentru verificari.
+
+    :param game: instanta ChessGame
+    :return: cheia pe 64 de biti (int)
+    """
+    key = 0
+    for color in Color:
+        for row, col in game.board.get_positions_of_color(color):
+            piece = game.board.get_piece(row, col)
+            key ^= PIECE_KEYS[color][piece.piece_type][row * 8 + col]
+
+    if game.current_player == Color.BLACK:
+        key ^= SIDE_KEY
+
+    for right, castle_key in zip(castle_rights_tuple(game.castle_rights), CASTLE_KEYS):
+        if right:
+            key ^= castle_key
+
+    if game.en_passant_target is not None:
+        key ^= EP_FILE_KEYS[game.en_passant_target[1]]
+
+    return key